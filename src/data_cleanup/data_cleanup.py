@@ -1,22 +1,24 @@
+import os
 import time
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 from rich.markup import escape
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from data_cleanup.data_cleanup_config import CleanupConfig
+from data_cleanup.data_cleanup_types import RelationshipMap
 from data_cleanup.data_cleanup_utils import (
     calculate_operations,
     display_hierarchy_summary,
     execute_cleanup,
     fetch_ids,
-    generate_cleanup_script,
+    find_bulk_deletes,
+    iter_cleanup_script,
     preload_all_foreign_keys,
 )
 from utils import DbTable, Hierarchy, MetadataService, get_config
-from utils.rich_utils import console
+from utils.rich_utils import console, create_progress
 
 
 def main() -> None:
@@ -24,9 +26,17 @@ def main() -> None:
         # Load environment variables and configuration
         load_dotenv(override=True)
         data_cleanup_config = get_config("data_cleanup")
-        config = CleanupConfig(data_cleanup_config)
+        config = CleanupConfig.from_dict(data_cleanup_config)
 
-        start_time = time.time()
+        # Prepare the output location up front so a bad path fails before the long analysis
+        script_dir = Path("./output/scripts")
+        script_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        script_file = script_dir / f"{config.database}_cleanup_{timestamp}.sql"
+        if not os.access(script_dir, os.W_OK):
+            raise PermissionError(f"Script directory is not writable: {script_dir}")
+
+        start_time = time.perf_counter_ns()
         # Display header
         console.print()
         console.rule("[bold]SQL Data Cleanup[/]")
@@ -48,80 +58,79 @@ def main() -> None:
 
         console.print()
 
-        # Setup Base
-        service = MetadataService(config.connection)
-        root_table = DbTable(schema_name=config.cleanup_schema, table_name=config.cleanup_table)
-        service.get_table_columns(root_table)
-        service.get_primary_key(root_table)
-
-        # Get the hierarchy
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold magenta]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Analyzing relationships...", total=1)
-            hierarchy: Hierarchy = service.build_hierarchy(root_table)
-            progress.update(
-                task, completed=1, description=f"Found {len(hierarchy.relationships)} relationships"
-            )
-
-        fk_constraint_manager = preload_all_foreign_keys(hierarchy, service, config)
-
-        # Get the IDs for cleanup
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold magenta]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Fetching data...", total=1)
-            root_ids = fetch_ids(config)
-            progress.update(
-                task,
-                completed=1,
-                description=f"Found {len(root_ids)} records in {root_table.table_name}",
-            )
-
-        if not root_ids:
-            console.print("[yellow]No data found for cleanup. Exiting.[/]")
-            return
-
-        # Get deletion order
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold magenta]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Determining deletion order...", total=1)
-            deletion_order = hierarchy.get_deletion_order()
-            progress.update(
-                task,
-                completed=1,
-                description=f"Determined deletion order for {len(deletion_order)} tables",
+        # Keep connections open across the many metadata and cascade queries
+        with config.connection.pooled():
+            # Setup Base
+            service = MetadataService(config.connection)
+            root_table = DbTable(schema_name=config.cleanup_schema, table_name=config.cleanup_table)
+            service.get_table_columns(root_table)
+            service.get_primary_key(root_table)
+
+            # Get the hierarchy
+            with create_progress() as progress:
+                task = progress.add_task("Analyzing relationships...", total=1)
+                hierarchy: Hierarchy = service.build_hierarchy(root_table)
+                progress.update(
+                    task,
+                    completed=1,
+                    description=f"Found {len(hierarchy.relationships)} relationships",
+                )
+
+            fk_constraint_manager = preload_all_foreign_keys(hierarchy, service, config)
+            # Built once, after preloading has added any additional relationships
+            rel_map = RelationshipMap.from_hierarchy(hierarchy)
+
+            # Get the IDs for cleanup
+            with create_progress() as progress:
+                task = progress.add_task("Fetching data...", total=1)
+                root_ids = fetch_ids(config)
+                progress.update(
+                    task,
+                    completed=1,
+                    description=f"Found {len(root_ids)} records in {root_table.table_name}",
+                )
+
+            if not root_ids:
+                console.print("[yellow]No data found for cleanup. Exiting.[/]")
+                return
+
+            # Get deletion order
+            with create_progress() as progress:
+                task = progress.add_task("Determining deletion order...", total=1)
+                deletion_order = hierarchy.get_deletion_order()
+                progress.update(
+                    task,
+                    completed=1,
+                    description=f"Determined deletion order for {len(deletion_order)} tables",
+                )
+
+            operations = calculate_operations(
+                service, hierarchy, root_table, root_ids, config, rel_map=rel_map
             )
+            display_hierarchy_summary(hierarchy, operations, deletion_order)
 
-        operations = calculate_operations(service, hierarchy, root_table, root_ids, config)
-        display_hierarchy_summary(hierarchy, operations, deletion_order)
-
-        script = generate_cleanup_script(operations, deletion_order, config, fk_constraint_manager)
-        script_dir = Path("./output/scripts")
-        script_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        script_file = script_dir / f"{config.database}_cleanup_{timestamp}.sql"
-
-        with open(script_file, "w") as f:
-            f.write(script)
+            # Stream the script to disk rather than building it in memory
+            bulk_deletes = find_bulk_deletes(service, operations, config)
+        script_lines = iter_cleanup_script(
+            operations, deletion_order, config, fk_constraint_manager, bulk_deletes
+        )
+        with open(script_file, "w", buffering=1 << 20) as f:
+            f.writelines(f"{line}\n" for line in script_lines)
 
         console.print(f"\n[green]Cleanup script saved to: {script_file}[/]")
 
         # Execute if in execute mode
         if config.cleanup_mode == "execute":
-            execute_cleanup(config, operations, deletion_order)
+            execute_cleanup(
+                config,
+                operations,
+                deletion_order,
+                deletion_waves=list(hierarchy.get_deletion_waves()),
+            )
 
         console.print()
         console.rule("[bold]Cleanup Complete[/]")
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
 
         console.print(f"Execution time: {execution_time:.4f} seconds")
         console.print()
@@ -1,70 +1,107 @@
-from typing import Any, Dict, Set
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Collection, Dict
 
-from utils import get_connection, modify_connection_for_database
+from utils import Connection, get_connection, modify_connection_for_database
 from utils.rich_utils import console
 
+# Rows fetched per round-trip when streaming query results
+DEFAULT_FETCH_ARRAY_SIZE = 10000
 
-class CleanupConfig:
-    """Configuration for database cleanup operations"""
-
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
-
-        # Validate and assign required fields
-        connection_var = config.get("conn")
-        if not connection_var:
-            raise ValueError("Connection variable not defined in config")
-        self.connection_var: str = connection_var
-
-        database = config.get("database")
-        if not database:
-            raise ValueError("Database is not defined in config")
-        self.database: str = database
+# Required config keys, with the error raised when each is missing
+REQUIRED_KEYS = {
+    "conn": "Connection variable not defined in config",
+    "database": "Database is not defined in config",
+    "table": "Table for cleanup is not defined in config",
+    "query_of_data_to_remove": "Query for data to remove is not defined in config",
+}
 
-        cleanup_table = config.get("table")
-        if not cleanup_table:
-            raise ValueError("Table for cleanup is not defined in config")
-        self.cleanup_table: str = cleanup_table
 
-        query = config.get("query_of_data_to_remove")
-        if not query:
-            raise ValueError("Query for data to remove is not defined in config")
-        self.query_of_cleanup_pk_values: str = query
+@dataclass
+class CleanupConfig:
+    """Configuration for database cleanup operations"""
 
-        self.batch_size: int = config.get("batch_size", 1000)
-        self.batch_threshold: int = config.get("batch_threshold", 1000)
-        self.cleanup_mode: str = config.get("cleanup_mode", "summary")
-        self.cleanup_schema: str = config.get("schema", "dbo")
+    connection_var: str
+    database: str
+    cleanup_table: str
+    query_of_cleanup_pk_values: str
+    batch_size: int = 1000
+    batch_threshold: int = 1000
+    cleanup_mode: str = "summary"
+    cleanup_schema: str = "dbo"
+    parallelism: int = 8
+    # Above 1, sibling tables are deleted concurrently and each table commits on its own,
+    # so there is no final commit prompt and a failure leaves a partial cleanup committed
+    max_parallel_deletes: int = 1
+    fetch_array_size: int = DEFAULT_FETCH_ARRAY_SIZE
+    use_temp_id_tables: bool = False
+    server_side_cascade: bool = True
+    # 0 disables TRUNCATE; otherwise tables of at least this many rows may be truncated
+    truncate_threshold: int = 0
+    # Normalized to a frozenset of lowercase schema.table names in __post_init__
+    disable_fk_tables: Collection[str] = ()
+
+    def __post_init__(self) -> None:
+        if self.parallelism < 1:
+            raise ValueError("parallelism must be at least 1")
+        if self.max_parallel_deletes < 1:
+            raise ValueError("max_parallel_deletes must be at least 1")
+        if self.fetch_array_size < 1:
+            raise ValueError("fetch_array_size must be at least 1")
+
+        self.disable_fk_tables = frozenset(
+            self._normalize_table_name(table_name) for table_name in self.disable_fk_tables
+        )
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "CleanupConfig":
+        """Create a CleanupConfig instance from a TOML config dictionary."""
+        for key, message in REQUIRED_KEYS.items():
+            if not config.get(key):
+                raise ValueError(message)
 
-        # Parse FK disable table list
         disable_fk_tables = config.get("disable_foreign_keys_for_tables", [])
         if not isinstance(disable_fk_tables, list):
             raise ValueError("disable_foreign_keys_for_tables must be a list of table names")
 
-        # Normalize table names and store as a set for fast lookups
-        self.disable_fk_tables: Set[str] = set()
-        for table_name in disable_fk_tables:
-            if not isinstance(table_name, str):
-                raise ValueError(
-                    f"Table name must be a string, got {type(table_name)}: {table_name}"
-                )
-
-            # Normalize format to schema.table (lowercase for comparison)
-            normalized_name = table_name.strip().lower()
-            if "." not in normalized_name:
-                # If no schema specified, use the cleanup schema
-                normalized_name = f"{self.cleanup_schema.lower()}.{normalized_name}"
-
-            self.disable_fk_tables.add(normalized_name)
-
-        # connection setup
-        self.connection = get_connection(self.connection_var)
-        self.connection = modify_connection_for_database(self.connection, self.database)
+        return cls(
+            connection_var=config["conn"],
+            database=config["database"],
+            cleanup_table=config["table"],
+            query_of_cleanup_pk_values=config["query_of_data_to_remove"],
+            batch_size=config.get("batch_size", 1000),
+            batch_threshold=config.get("batch_threshold", 1000),
+            cleanup_mode=config.get("cleanup_mode", "summary"),
+            cleanup_schema=config.get("schema", "dbo"),
+            parallelism=config.get("parallelism", 8),
+            max_parallel_deletes=config.get("max_parallel_deletes", 1),
+            fetch_array_size=config.get("fetch_array_size", DEFAULT_FETCH_ARRAY_SIZE),
+            use_temp_id_tables=config.get("use_temp_id_tables", False),
+            server_side_cascade=config.get("server_side_cascade", True),
+            truncate_threshold=config.get("truncate_threshold", 0),
+            disable_fk_tables=disable_fk_tables,
+        )
+
+    def _normalize_table_name(self, table_name: Any) -> str:
+        """Normalize a table name to lowercase schema.table, defaulting to the cleanup schema"""
+        if not isinstance(table_name, str):
+            raise ValueError(f"Table name must be a string, got {type(table_name)}: {table_name}")
+
+        normalized_name = table_name.strip().lower()
+        if "." not in normalized_name:
+            # If no schema specified, use the cleanup schema
+            normalized_name = f"{self.cleanup_schema.lower()}.{normalized_name}"
+        return normalized_name
+
+    @cached_property
+    def connection(self) -> Connection:
+        """Connection for the cleanup database, resolved on first use"""
+        connection = get_connection(self.connection_var)
+        return modify_connection_for_database(connection, self.database)
 
     def should_disable_foreign_keys(self, schema_name: str, table_name: str) -> bool:
         """Check if foreign keys should be disabled for the given table"""
-        normalized_table = f"{schema_name.lower()}.{table_name.lower()}"
-        return normalized_table in self.disable_fk_tables
+        return f"{schema_name}.{table_name}".lower() in self.disable_fk_tables
 
     def rich_display(self) -> None:
         """Display the configuration using Rich formatting"""
@@ -73,6 +110,14 @@ class CleanupConfig:
         console.print(f"Mode: [bold]{self.cleanup_mode}[/]")
         console.print(f"Batch Size: [bold]{self.batch_size}[/]")
         console.print(f"Batch Threshold: [bold]{self.batch_threshold}[/]")
+        console.print(f"Parallelism: [bold]{self.parallelism}[/]")
+        console.print(f"Max Parallel Deletes: [bold]{self.max_parallel_deletes}[/]")
+        if self.max_parallel_deletes > 1:
+            console.print("  [yellow]Each table commits separately; no final commit prompt[/]")
+        console.print(f"Fetch Array Size: [bold]{self.fetch_array_size}[/]")
+        console.print(f"Temp ID Tables: [bold]{self.use_temp_id_tables}[/]")
+        console.print(f"Server-side Cascade: [bold]{self.server_side_cascade}[/]")
+        console.print(f"Truncate Threshold: [bold]{self.truncate_threshold}[/]")
         if self.disable_fk_tables:
             console.print(f"FK Disable Tables: [bold]{len(self.disable_fk_tables)}[/] configured")
             for table in sorted(self.disable_fk_tables):
@@ -1,8 +1,29 @@
+import heapq
+import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Set
+from typing import Any, Collection, Dict, Iterator, List, Optional, Set, Tuple
 
-from utils import DbColumn, DbTable, Hierarchy, Relationship
+import numpy as np
+import numpy.typing as npt
+
+from utils import DbColumn, DbTable, Hierarchy, MetadataService, Relationship
+
+# SQL Server rejects a VALUES list with more rows than this in an INSERT
+MAX_VALUES_ROWS = 1000
+
+# Integer PK types whose IDs can be held in a compact int64 array
+INTEGER_PK_TYPES = frozenset({"tinyint", "smallint", "int", "bigint"})
+
+# String PK types and the OPENJSON column type used when their length isn't known; reading
+# keys as the column's own type family lets the DELETE seek the index instead of converting
+# every row of the column
+STRING_PK_JSON_TYPES = {
+    "char": "varchar(max)",
+    "varchar": "varchar(max)",
+    "nchar": "nvarchar(max)",
+    "nvarchar": "nvarchar(max)",
+}
 
 
 class ProcessingStatus(Enum):
@@ -25,76 +46,113 @@ class CascadeTask:
 
     def __post_init__(self) -> None:
         if not self.table_key:
-            self.table_key = f"{self.table.schema_name}.{self.table.table_name}"
+            self.table_key = self.table.key
 
 
 @dataclass
 class ProcessingQueue:
     """Queue for managing cascade processing tasks"""
 
-    tasks: List[CascadeTask] = field(default_factory=list)
+    tasks: Dict[str, CascadeTask] = field(default_factory=dict)  # "schema.table", task
     completed_tables: Set[str] = field(default_factory=set)
+    # Per-status counters kept in step with task statuses, so no query scans the tasks
+    _pending_count: int = field(default=0, init=False, repr=False)
+    _processing_count: int = field(default=0, init=False, repr=False)
+    # Min-heap of (level, insertion_seq, table_key); stale entries are skipped on read
+    _pending_heap: List[Tuple[int, int, str]] = field(default_factory=list, init=False, repr=False)
+    _seq: int = field(default=0, init=False, repr=False)
+
+    def _set_status(self, task: CascadeTask, status: ProcessingStatus) -> None:
+        """Change a task's status, keeping the status counters in sync"""
+        if task.status == ProcessingStatus.PENDING:
+            self._pending_count -= 1
+        elif task.status == ProcessingStatus.PROCESSING:
+            self._processing_count -= 1
+        if status == ProcessingStatus.PENDING:
+            self._pending_count += 1
+        elif status == ProcessingStatus.PROCESSING:
+            self._processing_count += 1
+        task.status = status
+
+    def _push_pending(self, task: CascadeTask) -> None:
+        """Push a heap entry for a task at its current level"""
+        heapq.heappush(self._pending_heap, (task.level, self._seq, task.table_key))
+        self._seq += 1
 
     def add_task(self, table: DbTable, ids: Set[Any], level: int = 0) -> CascadeTask:
         """Add a new task to the queue"""
-        table_key = f"{table.schema_name}.{table.table_name}"
+        table_key = table.key
 
         # Check if we already have a task for this table
-        existing_task = self.get_task(table_key)
+        existing_task = self.tasks.get(table_key)
         if existing_task:
-            # Merge IDs and update level if deeper
-            old_count = len(existing_task.ids)
-            existing_task.ids.update(ids)
-            new_count = len(existing_task.ids)
+            # Merge only the IDs the task doesn't have yet and update level if deeper
+            added_ids = ids - existing_task.ids
+            if added_ids:
+                existing_task.ids |= added_ids
+            level_changed = level > existing_task.level
             existing_task.level = max(existing_task.level, level)
 
             # Reset status if it was completed but we're adding more IDs
-            if existing_task.status == ProcessingStatus.COMPLETED and new_count > old_count:
-                existing_task.status = ProcessingStatus.PENDING
+            if existing_task.status == ProcessingStatus.COMPLETED and added_ids:
+                self._set_status(existing_task, ProcessingStatus.PENDING)
+                self._push_pending(existing_task)
+            elif existing_task.status == ProcessingStatus.PENDING and level_changed:
+                self._push_pending(existing_task)
 
             return existing_task
         else:
             # Create new task
             task = CascadeTask(table=table, table_key=table_key, ids=ids, level=level)
-            self.tasks.append(task)
+            self.tasks[table_key] = task
+            if task.status == ProcessingStatus.PENDING:
+                self._pending_count += 1
+                self._push_pending(task)
             return task
 
     def get_next_task(self) -> CascadeTask | None:
         """Get the next pending task to process"""
-        pending_tasks = [t for t in self.tasks if t.status == ProcessingStatus.PENDING]
-        if not pending_tasks:
-            return None
-
-        # Process tasks by level (breadth-first) to avoid deep recursion issues
-        pending_tasks.sort(key=lambda t: t.level)
-        return pending_tasks[0]
+        # Process tasks by level (breadth-first) to avoid deep recursion issues.
+        # Entries whose task is no longer pending, or has moved level, are dropped lazily.
+        while self._pending_heap:
+            level, _, table_key = self._pending_heap[0]
+            task = self.tasks[table_key]
+            if task.status == ProcessingStatus.PENDING and task.level == level:
+                return task
+            heapq.heappop(self._pending_heap)
+        return None
 
     def get_task(self, table_key: str) -> CascadeTask | None:
         """Get a task by table key"""
-        return next((t for t in self.tasks if t.table_key == table_key), None)
+        return self.tasks.get(table_key)
 
     def mark_completed(self, table_key: str) -> None:
         """Mark a task as completed"""
         task = self.get_task(table_key)
         if task:
-            task.status = ProcessingStatus.COMPLETED
+            self._set_status(task, ProcessingStatus.COMPLETED)
             self.completed_tables.add(table_key)
 
     def mark_processing(self, table_key: str) -> None:
         """Mark a task as currently being processed"""
         task = self.get_task(table_key)
         if task:
-            task.status = ProcessingStatus.PROCESSING
+            self._set_status(task, ProcessingStatus.PROCESSING)
 
     def has_pending_tasks(self) -> bool:
         """Check if there are any pending tasks"""
-        return any(t.status == ProcessingStatus.PENDING for t in self.tasks)
+        return self._pending_count > 0
+
+    @property
+    def tasks_list(self) -> List[CascadeTask]:
+        """Get all tasks as a list, in insertion order"""
+        return list(self.tasks.values())
 
     def get_all_operations(self) -> Dict[str, "CleanupOperation"]:
         """Convert all tasks to cleanup operations"""
 
         operations = {}
-        for task in self.tasks:
+        for task in self.tasks.values():
             if task.ids:  # Only include tasks with actual IDs
                 operations[task.table_key] = CleanupOperation(table=task.table, ids=task.ids)
 
@@ -103,10 +161,10 @@ class ProcessingQueue:
     @property
     def summary(self) -> str:
         """Get a summary of the queue status"""
-        pending = sum(1 for t in self.tasks if t.status == ProcessingStatus.PENDING)
-        processing = sum(1 for t in self.tasks if t.status == ProcessingStatus.PROCESSING)
+        pending = self._pending_count
+        processing = self._processing_count
         completed = len(self.completed_tables)
-        total_records = sum(len(t.ids) for t in self.tasks)
+        total_records = sum(len(t.ids) for t in self.tasks.values())
 
         return (
             f"Tasks: {pending} pending,"
@@ -120,6 +178,8 @@ class RelationshipMap:
     """Organizes relationships for efficient cascade processing"""
 
     relationships_by_parent: Dict[str, List[Relationship]] = field(default_factory=dict)
+    # Per parent, the same relationships grouped by child table so each child is queried once
+    child_groups_by_parent: Dict[str, List[List[Relationship]]] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Initialize the relationship map if not provided"""
@@ -131,17 +191,29 @@ class RelationshipMap:
         relationships_by_parent: Dict[str, List[Relationship]] = {}
 
         for rel in hierarchy.relationships:
-            parent_key = f"{rel.referenced_table.schema_name}.{rel.referenced_table.table_name}"
-            if parent_key not in relationships_by_parent:
-                relationships_by_parent[parent_key] = []
-            relationships_by_parent[parent_key].append(rel)
-
-        return cls(relationships_by_parent=relationships_by_parent)
+            parent_key = rel.referenced_table.key
+            relationships_by_parent.setdefault(parent_key, []).append(rel)
+
+        child_groups_by_parent: Dict[str, List[List[Relationship]]] = {}
+        for parent_key, relationships in relationships_by_parent.items():
+            groups: Dict[str, List[Relationship]] = {}
+            for rel in relationships:
+                groups.setdefault(rel.parent_table.key, []).append(rel)
+            child_groups_by_parent[parent_key] = list(groups.values())
+
+        return cls(
+            relationships_by_parent=relationships_by_parent,
+            child_groups_by_parent=child_groups_by_parent,
+        )
 
     def get_child_relationships(self, parent_table_key: str) -> List[Relationship]:
         """Get all relationships where the given table is the parent (referenced table)"""
         return self.relationships_by_parent.get(parent_table_key, [])
 
+    def get_child_relationship_groups(self, parent_table_key: str) -> List[List[Relationship]]:
+        """Get the parent's child relationships grouped by child (FK holder) table"""
+        return self.child_groups_by_parent.get(parent_table_key, [])
+
     def has_children(self, parent_table_key: str) -> bool:
         """Check if a table has any child relationships"""
         return parent_table_key in self.relationships_by_parent
@@ -159,26 +231,73 @@ class CascadeStats:
 
     def update_from_queue(self, queue: ProcessingQueue) -> None:
         """Update stats from a processing queue"""
-        self.tables_processed = len(
-            [t for t in queue.tasks if t.status == ProcessingStatus.COMPLETED]
-        )
-        self.total_records_found = sum(len(t.ids) for t in queue.tasks)
-        if queue.tasks:
-            self.max_level_reached = max(t.level for t in queue.tasks)
+        tasks = queue.tasks.values()
+        self.tables_processed = sum(1 for t in tasks if t.status == ProcessingStatus.COMPLETED)
+        self.total_records_found = sum(len(t.ids) for t in tasks)
+        self.max_level_reached = max((t.level for t in tasks), default=0)
 
 
-def format_id_list_for_sql(ids: Set[Any]) -> str:
-    """Format a set of IDs for use in SQL IN clause"""
-    formatted_ids = []
-    for id_val in ids:
-        if isinstance(id_val, str):
-            formatted_ids.append(f"'{id_val}'")
-        elif id_val is None:
-            formatted_ids.append("NULL")
-        else:
-            formatted_ids.append(str(id_val))
+def format_sql_literal(value: Any) -> str:
+    """Format a single value as a SQL literal, escaping quotes in strings"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
 
-    return ", ".join(formatted_ids)
+def format_sql_literals(values: Collection[Any]) -> List[str]:
+    """Format a column of values as SQL literals"""
+    # Values come from a single key column, so the first value's type is the column's type
+    first_type = type(next(iter(values), None))
+    if first_type is int and None not in values:
+        return list(map(str, values))
+    if first_type is str and None not in values:
+        # Inline escaping skips format_sql_literal's per-value call and type checks
+        return ["'" + value.replace("'", "''") + "'" for value in values]
+
+    return list(map(format_sql_literal, values))
+
+
+def format_id_list_for_sql(ids: Collection[Any]) -> str:
+    """Format a set of IDs for use in SQL IN clause"""
+    if isinstance(ids, np.ndarray):
+        # tolist() yields Python ints in one C pass, and str() on those is about 3x faster
+        # than numpy's astype(str), which builds fixed-width unicode values
+        return ", ".join(map(str, ids.tolist()))
+    if type(next(iter(ids), None)) is int and None not in ids:
+        return ", ".join(map(str, ids))
+    return ", ".join(format_sql_literals(ids))
+
+
+def openjson_column_type(data_type: str) -> Optional[str]:
+    """
+    Return the type to read a key column's values from OPENJSON as, or None for key types
+    that aren't bound as JSON (their deletes use literal IN lists instead).
+    """
+    base, _, length = data_type.lower().partition("(")
+    base = base.strip()
+    if base in INTEGER_PK_TYPES:
+        return base
+    if base not in STRING_PK_JSON_TYPES:
+        return None
+
+    length = length.rstrip(")").strip()
+    if not length or length in ("-1", "max"):
+        return STRING_PK_JSON_TYPES[base]
+    return f"{base}({length})"
+
+
+def create_temp_id_table_sql(id_table: str, table: DbTable, pk_columns: List[DbColumn]) -> str:
+    """Build a SELECT INTO that creates an empty temp table shaped like the table's PK"""
+    columns_sql = ", ".join(f"[{col.column_name}]" for col in pk_columns)
+
+    # Copying the columns from the source table keeps their exact types; the UNION ALL
+    # stops SELECT INTO from carrying over an IDENTITY property that would reject inserts
+    return (
+        f"SELECT TOP 0 {columns_sql} INTO {id_table} FROM {table.full_table_name()} "
+        f"UNION ALL SELECT TOP 0 {columns_sql} FROM {table.full_table_name()}"
+    )
 
 
 class CleanupOperation:
@@ -188,7 +307,70 @@ class CleanupOperation:
         self.table = table
         # For single-column PKs, ids will be a set of single values
         # For multi-column PKs, ids will be a set of tuples
+        pk = table.primary_key
+        if pk and len(pk.columns) > 1:
+            # Normalize every key to a tuple once, so later passes need no per-ID type checks
+            ids = {t if isinstance(t, tuple) else (t,) for t in ids}
         self.ids = ids
+        self._delete_prefix = f"DELETE FROM [{table.schema_name}].[{table.table_name}] WHERE "
+        self._columns: List[List[Any]] | None = None
+        self._literal_columns: List[List[str]] | None = None
+        self._id_array: Optional[npt.NDArray[np.int64]] = None
+
+    def to_columns(self) -> List[List[Any]]:
+        """
+        Transpose the primary key tuples into one list per PK column, built once.
+        Values at the same index across the lists form one key.
+        """
+        if self._columns is None:
+            pk = self.table.primary_key
+            column_count = len(pk.columns) if pk and pk.columns else 1
+
+            # Multi-column keys are already tuples; single values are wrapped here
+            rows: Collection[Any] = (
+                self.ids
+                if column_count > 1
+                else [t if isinstance(t, tuple) else (t,) for t in self.ids]
+            )
+            if not rows:
+                self._columns = [[] for _ in range(column_count)]
+                return self._columns
+
+            # A partial key would delete more rows than intended, so reject it outright
+            try:
+                columns = [list(col) for col in zip(*rows, strict=True)]
+            except ValueError as e:
+                raise ValueError(f"Inconsistent primary key values for {self.table.key}") from e
+            if len(columns) != column_count:
+                raise ValueError(
+                    f"Primary key values for {self.table.key} have {len(columns)} parts, "
+                    f"expected {column_count}"
+                )
+            self._columns = columns
+
+        return self._columns
+
+    def to_literal_columns(self) -> List[List[str]]:
+        """Return the to_columns() lists with every value formatted as a SQL literal, built once"""
+        if self._literal_columns is None:
+            self._literal_columns = [format_sql_literals(col) for col in self.to_columns()]
+        return self._literal_columns
+
+    def _int_id_array(self) -> Optional[npt.NDArray[np.int64]]:
+        """Return the IDs of a single-column integer PK as a sorted int64 array, if possible"""
+        if self._id_array is None:
+            pk = self.table.primary_key
+            if not pk or len(pk.columns) != 1:
+                return None
+            if pk.columns[0].data_type.lower() not in INTEGER_PK_TYPES:
+                return None
+            try:
+                ids = np.fromiter(self.ids, dtype=np.int64, count=len(self.ids))
+            except (TypeError, ValueError, OverflowError):
+                return None
+            self._id_array = np.unique(ids)
+
+        return self._id_array
 
     def generate_delete_sql(self) -> str:
         """Generate DELETE SQL statement for this operation"""
@@ -199,87 +381,216 @@ class CleanupOperation:
 
         if len(pk_columns) == 1:
             # Single column primary key
-            pk_column = pk_columns[0].column_name
             id_list = format_id_list_for_sql(self.ids)
-            return f"""
-            DELETE FROM [{self.table.schema_name}].[{self.table.table_name}]
-            WHERE [{pk_column}] IN ({id_list})
-            """
-        else:
-            # Multi-column primary key
-            where_clause = self._build_multi_column_pk_where_clause(pk_columns, self.ids)
-            return f"""
-            DELETE FROM [{self.table.schema_name}].[{self.table.table_name}]
-            WHERE {where_clause}
-            """
+            return self._delete_prefix + f"[{pk_columns[0].column_name}] IN ({id_list})"
+
+        # Multi-column primary key
+        where_clause = self._build_multi_column_pk_where_clause(
+            pk_columns, self.to_columns(), self.to_literal_columns()
+        )
+        return self._delete_prefix + where_clause
+
+    def try_emit_bulk_delete(self, service: MetadataService) -> Optional[str]:
+        """
+        Return a TRUNCATE for this table when the IDs cover every row and truncating is safe.
+        The statement locks the table and re-checks its row count and key checksum, so rows
+        added or replaced after generation make the script fail instead of being truncated.
+        """
+        if not self.ids or not self.table.primary_key or not self.table.primary_key.columns:
+            return None
+        if not service.can_truncate(self.table):
+            return None
+
+        record_count = len(self.ids)
+        fingerprint = service.get_key_fingerprint(self.table)
+        if fingerprint is None or fingerprint[0] != record_count:
+            return None
+
+        table_name = self.table.full_table_name()
+        checksum_sql = service.key_checksum_expression(self.table)
+        message = f"Rows of {table_name} changed since this script was generated"
+        return (
+            f"IF EXISTS (SELECT 1 FROM {table_name} WITH (TABLOCKX, HOLDLOCK)\n"
+            f"    HAVING COUNT_BIG(*) <> {record_count} OR {checksum_sql} <> {fingerprint[1]})\n"
+            f"    THROW 50000, {format_sql_literal(message)}, 1;\n"
+            f"TRUNCATE TABLE {table_name}"
+        )
 
     def generate_batched_delete_sql(self, batch_size: int) -> List[str]:
         """Generate multiple DELETE statements for batch processing"""
+        return list(self.iter_batched_delete_sql(batch_size))
+
+    def iter_batched_delete_sql(self, batch_size: int) -> Iterator[str]:
+        """Yield DELETE statements for batch processing, one batch at a time"""
         if (
             not self.ids
             or not self.table.primary_key
             or not self.table.primary_key.columns
             or batch_size <= 0
         ):
-            return []
+            return
 
         pk_columns = self.table.primary_key.columns
-        id_list = list(self.ids)
-        delete_statements = []
-
-        for i in range(0, len(id_list), batch_size):
-            batch = id_list[i : i + batch_size]
-
-            if len(pk_columns) == 1:
-                # Single column PK
-                pk_column = pk_columns[0].column_name
-                batch_id_list = format_id_list_for_sql(set(batch))
-                delete_sql = f"""
-                DELETE FROM [{self.table.schema_name}].[{self.table.table_name}]
-                WHERE [{pk_column}] IN ({batch_id_list})
-                """
-            else:
-                # Multi-column PK
-                where_clause = self._build_multi_column_pk_where_clause(pk_columns, set(batch))
-                delete_sql = f"""
-                DELETE FROM [{self.table.schema_name}].[{self.table.table_name}]
-                WHERE {where_clause}
-                """
-
-            delete_statements.append(delete_sql)
-
-        return delete_statements
+
+        if len(pk_columns) == 1:
+            # Single column PK
+            # Slices of a unique array or list are already unique, so batches are used as-is.
+            # Integer keys use a sorted int64 array, so each batch is a zero-copy view.
+            pk_column = pk_columns[0].column_name
+            id_array = self._int_id_array()
+            if id_array is not None:
+                for i in range(0, len(id_array), batch_size):
+                    batch_id_list = format_id_list_for_sql(id_array[i : i + batch_size])
+                    yield self._delete_prefix + f"[{pk_column}] IN ({batch_id_list})"
+                return
+
+            id_list = list(self.ids)
+            for i in range(0, len(id_list), batch_size):
+                batch_id_list = format_id_list_for_sql(id_list[i : i + batch_size])
+                yield self._delete_prefix + f"[{pk_column}] IN ({batch_id_list})"
+        else:
+            # Multi-column PK - batch by slicing each column list
+            columns = self.to_columns()
+            literal_columns = self.to_literal_columns()
+            for i in range(0, len(columns[0]), batch_size):
+                batch_columns = [col[i : i + batch_size] for col in columns]
+                batch_literals = [col[i : i + batch_size] for col in literal_columns]
+                where_clause = self._build_multi_column_pk_where_clause(
+                    pk_columns, batch_columns, batch_literals
+                )
+                yield self._delete_prefix + where_clause
+
+    def generate_join_delete_sql(self, id_table: str) -> str:
+        """Generate a single DELETE that joins the table to a temp table of its PK values"""
+        pk = self.table.primary_key
+        if not pk or not pk.columns:
+            raise ValueError(f"Table {self.table.key} has no primary key")
+
+        join_conditions = " AND ".join(
+            f"t.[{col.column_name}] = i.[{col.column_name}]" for col in pk.columns
+        )
+        return (
+            f"DELETE t FROM {self.table.full_table_name()} AS t "
+            f"INNER JOIN {id_table} AS i ON {join_conditions}"
+        )
+
+    def iter_temp_table_delete_sql(self, batch_size: int) -> Iterator[str]:
+        """
+        Yield statements that load the IDs into a temp table and delete with one join.
+        The inserts are split at SQL Server's limit of 1000 rows per VALUES list.
+        """
+        pk = self.table.primary_key
+        if not self.ids or not pk or not pk.columns or batch_size <= 0:
+            return
+
+        id_table = "#del_ids"
+        columns_sql = ", ".join(f"[{col.column_name}]" for col in pk.columns)
+        rows = list(map(", ".join, zip(*self.to_literal_columns(), strict=True)))
+        rows_per_insert = min(batch_size, MAX_VALUES_ROWS)
+
+        yield create_temp_id_table_sql(id_table, self.table, pk.columns)
+        for i in range(0, len(rows), rows_per_insert):
+            values_sql = "), (".join(rows[i : i + rows_per_insert])
+            yield f"INSERT INTO {id_table} ({columns_sql}) VALUES ({values_sql})"
+        yield self.generate_join_delete_sql(id_table)
+        yield f"DROP TABLE {id_table}"
+
+    def can_bind_ids_as_json(self) -> bool:
+        """Whether every PK column has a type generate_parameterized_delete can bind"""
+        pk = self.table.primary_key
+        if not pk or not pk.columns:
+            return False
+        return all(openjson_column_type(col.data_type) is not None for col in pk.columns)
+
+    def generate_parameterized_delete(self, batch: Collection[Any]) -> Tuple[str, List[str]]:
+        """
+        Generate a DELETE for a batch of IDs bound as a single JSON array parameter.
+        The statement text is the same for every batch, so SQL Server reuses one cached plan.
+        OPENJSON reads the IDs as the PK columns' own types, so the PK index is still seeked.
+        """
+        pk = self.table.primary_key
+        if not pk or not pk.columns or not self.can_bind_ids_as_json():
+            raise ValueError(f"Table {self.table.key} has no primary key that binds as JSON")
+
+        if len(pk.columns) == 1:
+            column = pk.columns[0].column_name
+            json_type = openjson_column_type(pk.columns[0].data_type)
+            delete_sql = self._delete_prefix + (
+                f"[{column}] IN (SELECT v.[{column}] "
+                f"FROM OPENJSON(?) WITH ([{column}] {json_type} '$') AS v)"
+            )
+        else:
+            # Multi-column keys are sent as an array of arrays and matched by position
+            table_name = self.table.full_table_name()
+            with_columns = ", ".join(
+                f"[{col.column_name}] {openjson_column_type(col.data_type)} '$[{i}]'"
+                for i, col in enumerate(pk.columns)
+            )
+            conditions = " AND ".join(
+                f"{table_name}.[{col.column_name}] = v.[{col.column_name}]" for col in pk.columns
+            )
+            delete_sql = self._delete_prefix + (
+                f"EXISTS (SELECT 1 FROM OPENJSON(?) WITH ({with_columns}) AS v WHERE {conditions})"
+            )
+
+        values = batch.tolist() if isinstance(batch, np.ndarray) else list(batch)
+        return delete_sql, [json.dumps(values)]
+
+    def iter_parameterized_deletes(self, batch_size: int) -> Iterator[Tuple[str, List[str]]]:
+        """Yield parameterized DELETE statements and their parameters, one batch at a time"""
+        if not self.ids or batch_size <= 0:
+            return
+
+        id_array = self._int_id_array()
+        ids: Any = id_array if id_array is not None else list(self.ids)
+        for i in range(0, len(ids), batch_size):
+            yield self.generate_parameterized_delete(ids[i : i + batch_size])
 
     def _build_multi_column_pk_where_clause(
-        self, pk_columns: List[DbColumn], pk_values: Set[Any]
+        self,
+        pk_columns: List[DbColumn],
+        value_columns: List[List[Any]],
+        literal_columns: List[List[str]],
     ) -> str:
-        """Build WHERE clause for multi-column primary key deletion"""
-        where_clauses = []
+        """
+        Build WHERE clause for multi-column primary key deletion from per-column value lists
+        and the same values already formatted as SQL literals.
+        SQL Server has no (col1, col2) IN (...) row constructor, so complete rows are
+        matched with a single EXISTS against a VALUES table. Rows containing NULLs
+        can't match by equality and fall back to AND/IS NULL conditions.
+        """
+        null_rows: Set[int] = set()
+        for col in value_columns:
+            if None in col:
+                null_rows.update(i for i, val in enumerate(col) if val is None)
 
-        for pk_tuple in pk_values:
-            # Handle case where pk_tuple might be a single value
-            # shouldn't happen for multi-col PK but safety check
-            if not isinstance(pk_tuple, (tuple, list)):
-                pk_tuple = (pk_tuple,)
+        rows: Iterator[str] = map(", ".join, zip(*literal_columns, strict=True))
+        if null_rows:
+            rows = (row for i, row in enumerate(rows) if i not in null_rows)
+        values_sql = "), (".join(rows)
 
+        where_clauses = []
+        if values_sql:
+            table_name = self.table.full_table_name()
+            alias_columns = ", ".join(f"[{col.column_name}]" for col in pk_columns)
+            join_conditions = " AND ".join(
+                f"{table_name}.[{col.column_name}] = v.[{col.column_name}]" for col in pk_columns
+            )
+            where_clauses.append(
+                f"EXISTS (SELECT 1 FROM (VALUES ({values_sql})) AS v({alias_columns}) "
+                f"WHERE {join_conditions})"
+            )
+
+        for i in sorted(null_rows):
             conditions = []
-            for i, pk_col in enumerate(pk_columns):
-                if i >= len(pk_tuple):
-                    break
-
-                val = pk_tuple[i]
-                col_name = pk_col.column_name
-
-                if val is None:
-                    conditions.append(f"[{col_name}] IS NULL")
-                elif isinstance(val, str):
-                    val_escaped = val.replace("'", "''")
-                    conditions.append(f"[{col_name}] = '{val_escaped}'")
+            for pk_col, col, literals in zip(
+                pk_columns, value_columns, literal_columns, strict=True
+            ):
+                if col[i] is None:
+                    conditions.append(f"[{pk_col.column_name}] IS NULL")
                 else:
-                    conditions.append(f"[{col_name}] = {val}")
-
-            if conditions:
-                where_clauses.append(f"({' AND '.join(conditions)})")
+                    conditions.append(f"[{pk_col.column_name}] = {literals[i]}")
+            where_clauses.append(f"({' AND '.join(conditions)})")
 
         return " OR ".join(where_clauses) if where_clauses else "1=0"
 
@@ -343,15 +654,18 @@ class ForeignKeyConstraintManager:
     """Manages foreign key constraints that need to be disabled/enabled during cleanup"""
 
     constraints: List[ForeignKeyConstraintInfo] = field(default_factory=list)
+    # (constraint name, parent table) of every managed constraint, for O(1) duplicate checks
+    _constraint_keys: Set[Tuple[str, str]] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._constraint_keys = {(c.constraint_name, c.parent_table_key) for c in self.constraints}
 
     def add_constraint(self, constraint: ForeignKeyConstraintInfo) -> None:
         """Add a constraint to be managed"""
         # Avoid duplicates
-        if not any(
-            c.constraint_name == constraint.constraint_name
-            and c.parent_table_key == constraint.parent_table_key
-            for c in self.constraints
-        ):
+        key = (constraint.constraint_name, constraint.parent_table_key)
+        if key not in self._constraint_keys:
+            self._constraint_keys.add(key)
             self.constraints.append(constraint)
 
     def get_constraints_for_table(self, schema: str, table: str) -> List[ForeignKeyConstraintInfo]:
@@ -1,23 +1,36 @@
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Set
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
+from queue import Queue
+from typing import Any, Collection, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from rich.markup import escape
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm
 
-from data_cleanup.data_cleanup_config import CleanupConfig
+from data_cleanup.data_cleanup_config import DEFAULT_FETCH_ARRAY_SIZE, CleanupConfig
 from data_cleanup.data_cleanup_types import (
     CascadeStats,
+    CascadeTask,
     CleanupOperation,
     ForeignKeyConstraintInfo,
     ForeignKeyConstraintManager,
     ProcessingQueue,
     RelationshipMap,
+    create_temp_id_table_sql,
     format_id_list_for_sql,
+    format_sql_literal,
+    format_sql_literals,
 )
 from utils import DbColumn, DbTable, Hierarchy, MetadataService, Relationship
-from utils.rich_utils import console, create_table
+from utils.rich_utils import console, create_progress, create_table
+
+
+def _iter_rows(cursor: Any, array_size: int) -> Iterator[Any]:
+    """Stream the current result set in fetchmany chunks instead of materializing it"""
+    while rows := cursor.fetchmany(array_size):
+        yield from rows
 
 
 def fetch_ids(config: CleanupConfig) -> List[Any]:
@@ -25,7 +38,7 @@ def fetch_ids(config: CleanupConfig) -> List[Any]:
     with config.connection.get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(config.query_of_cleanup_pk_values)
-        return [row[0] for row in cursor.fetchall()]
+        return [row[0] for row in _iter_rows(cursor, config.fetch_array_size)]
 
 
 def calculate_operations(
@@ -34,20 +47,33 @@ def calculate_operations(
     root_table: DbTable,
     root_ids: List[Any],
     config: CleanupConfig,
+    rel_map: Optional[RelationshipMap] = None,
 ) -> Dict[str, CleanupOperation]:
-    """Calculate all operations needed for cleanup using recursive cascade"""
+    """
+    Calculate all operations needed for cleanup using recursive cascade.
+    Pass a prebuilt rel_map to reuse it; otherwise one is built from the hierarchy.
+    """
     if not root_table.primary_key or not root_table.primary_key.columns:
         raise ValueError(f"Root table {root_table.full_table_name()} must have a primary key")
 
     # Initialize cascade processing structures
     queue = ProcessingQueue()
-    relationship_map = RelationshipMap.from_hierarchy(hierarchy)
+    relationship_map = rel_map if rel_map is not None else RelationshipMap.from_hierarchy(hierarchy)
     stats = CascadeStats()
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     queue.add_task(root_table, set(root_ids), level=0)
 
+    # Acyclic hierarchies are resolved on the server in a single round-trip;
+    # otherwise the breadth-first loop below does the work
+    relationships_processed = _run_server_side_cascade(
+        service, hierarchy, root_table, queue, config
+    )
+    if relationships_processed is not None:
+        console.print("Cascade resolved in a single server-side batch")
+        stats.relationships_processed = relationships_processed
+
     # Process cascade using breadth-first approach
     iteration = 0
     while queue.has_pending_tasks():
@@ -74,28 +100,13 @@ def calculate_operations(
             queue.mark_completed(task.table_key)
             continue
 
-        # Process each child relationship
-        for relationship in child_relationships:
-            fk_table = relationship.parent_table
-            referenced_table = relationship.referenced_table
-
-            referenced_values = get_referenced_column_values(
-                service, referenced_table, task.ids, relationship.referenced_columns, config
-            )
-
-            if not referenced_values:
-                continue
-
-            # Find child primary key values
-            child_pk_values = find_child_primary_keys(
-                service, fk_table, relationship.parent_columns, referenced_values, config
-            )
-
-            if child_pk_values:
-                queue.add_task(fk_table, child_pk_values, level=task.level + 1)
-
-                console.print(f"  → {fk_table.table_name}: {len(child_pk_values):,} records")
-                stats.relationships_processed += 1
+        stats.relationships_processed += _process_child_relationships(
+            service,
+            task,
+            relationship_map.get_child_relationship_groups(task.table_key),
+            queue,
+            config,
+        )
 
         # Mark current task as completed
         queue.mark_completed(task.table_key)
@@ -109,7 +120,7 @@ def calculate_operations(
             break
 
     # Update final stats
-    stats.processing_time_seconds = time.time() - start_time
+    stats.processing_time_seconds = (time.perf_counter_ns() - start_time) / 1e9
     stats.update_from_queue(queue)
 
     # Display final statistics
@@ -127,145 +138,382 @@ def calculate_operations(
     return operations
 
 
-def get_referenced_column_values(
+def _process_child_relationships(
     service: MetadataService,
-    parent_table: DbTable,
-    parent_ids: Set[Any],
-    referenced_columns: List[DbColumn],
+    task: CascadeTask,
+    groups: List[List[Relationship]],
+    queue: ProcessingQueue,
     config: CleanupConfig,
-) -> List[tuple[Any, ...]]:
-    """Get the values of referenced columns for the given parent PKs"""
-    if not parent_table.primary_key or not parent_table.primary_key.columns:
-        console.print(
-            f"[yellow]No primary key found for {escape(parent_table.full_table_name())}[/]"
-        )
-        return []
+) -> int:
+    """
+    Queue the child records of a task and return the number of relationships that found any.
+    Each group holds every relationship from the task's table to one child table.
+    """
+    # Each lookup opens its own connection, so child tables are queried concurrently;
+    # results are applied to the queue here on the calling thread
+    with ThreadPoolExecutor(max_workers=min(config.parallelism, len(groups))) as executor:
+        futures = [
+            executor.submit(
+                _find_child_pks_joined,
+                service,
+                relationships[0].parent_table,
+                relationships,
+                task.ids,
+                config,
+            )
+            for relationships in groups
+        ]
 
-    pk_columns = parent_table.primary_key.columns
-    ref_columns_sql = ", ".join([f"[{col.column_name}]" for col in referenced_columns])
+    relationships_processed = 0
+    for relationships, future in zip(groups, futures, strict=True):
+        fk_table = relationships[0].parent_table
+        child_pk_values = future.result()
 
-    # Check if we should use batching
-    if config.batch_threshold > 0 and len(parent_ids) >= config.batch_threshold:
-        console.print(f"      Using batched processing for {len(parent_ids)} IDs")
-        return _process_referenced_values_in_batches(
-            service, parent_table, parent_ids, ref_columns_sql, pk_columns, config.batch_size
-        )
-    else:
-        # Single query for smaller datasets
-        where_clause = _build_pk_where_clause(pk_columns, parent_ids)
-        query = f"""
-        SELECT DISTINCT {ref_columns_sql}
-        FROM [{parent_table.schema_name}].[{parent_table.table_name}]
-        WHERE {where_clause}
-        """
-        results = _execute_referenced_values_query(service, query)
-        return results
+        if child_pk_values:
+            queue.add_task(fk_table, child_pk_values, level=task.level + 1)
 
+            console.print(f"  → {fk_table.table_name}: {len(child_pk_values):,} records")
+            relationships_processed += len(relationships)
 
-def _build_pk_where_clause(pk_columns: List[DbColumn], pk_values: Set[Any]) -> str:
-    """Build WHERE clause for primary key matching"""
-    if len(pk_columns) == 1:
-        # Single column PK - use IN clause
-        pk_column = pk_columns[0].column_name
-        id_list = format_id_list_for_sql(pk_values)
-        return f"[{pk_column}] IN ({id_list})"
-    else:
-        # Multi-column PK - build OR conditions
-        where_clauses = []
-        for pk_tuple in pk_values:
-            # Handle case where pk_tuple might be a single value
-            if not isinstance(pk_tuple, (tuple, list)):
-                pk_tuple = (pk_tuple,)
-
-            conditions = []
-            for i, pk_col in enumerate(pk_columns):
-                if i >= len(pk_tuple):
-                    break
-
-                val = pk_tuple[i]
-                col_name = pk_col.column_name
-
-                if val is None:
-                    conditions.append(f"[{col_name}] IS NULL")
-                elif isinstance(val, str):
-                    val_escaped = val.replace("'", "''")
-                    conditions.append(f"[{col_name}] = '{val_escaped}'")
+    return relationships_processed
+
+
+def _build_cascade_batch(
+    hierarchy: Hierarchy, root_table: DbTable, root_ids: Set[Any]
+) -> Optional[tuple[str, List[tuple[DbTable, int]]]]:
+    """
+    Build one SQL batch computing the whole cascade with a temp table per table.
+    Tables are filled parent-first, each from the union of joins to its parents' temp tables,
+    and then selected back as one result set per table. Returns the batch and the
+    (table, level) order of its result sets, or None if the hierarchy has a cycle or a
+    table without a primary key, which the breadth-first cascade handles instead.
+    """
+    sorter: TopologicalSorter[str] = TopologicalSorter()
+    tables = {root_table.key: root_table}
+    incoming: Dict[str, List[Relationship]] = {}
+    sorter.add(root_table.key)
+    for rel in hierarchy.relationships:
+        child_key = rel.parent_table.key
+        parent_key = rel.referenced_table.key
+        if child_key == parent_key:
+            return None
+        tables.setdefault(child_key, rel.parent_table)
+        tables.setdefault(parent_key, rel.referenced_table)
+        incoming.setdefault(child_key, []).append(rel)
+        sorter.add(child_key, parent_key)
+
+    try:
+        order = list(sorter.static_order())
+    except CycleError:
+        return None
+
+    if any(not t.primary_key or not t.primary_key.columns for t in tables.values()):
+        return None
+
+    temp_names = {key: f"#cascade_{i}" for i, key in enumerate(order)}
+    levels: Dict[str, int] = {}
+    # Clear tables a failed earlier batch may have left on a reused session
+    statements = ["SET NOCOUNT ON;"] + [
+        f"IF OBJECT_ID('tempdb..{name}') IS NOT NULL DROP TABLE {name};"
+        for name in temp_names.values()
+    ]
+
+    for key in order:
+        table = tables[key]
+        pk_columns = table.primary_key.columns if table.primary_key else []
+        temp_name = temp_names[key]
+
+        if key == root_table.key:
+            levels[key] = 0
+            pk_select = ", ".join(f"[{col.column_name}]" for col in pk_columns)
+            statements.append(
+                f"SELECT {pk_select} INTO {temp_name} FROM {table.full_table_name()} "
+                f"WHERE {_build_pk_where_clause(pk_columns, root_ids)};"
+            )
+            continue
+
+        rels = incoming.get(key, [])
+        if not rels:
+            # A table the root can't reach is left to the breadth-first cascade
+            return None
+        levels[key] = max(levels[rel.referenced_table.key] for rel in rels) + 1
+        pk_select = ", ".join(f"c.[{col.column_name}]" for col in pk_columns)
+
+        branches = []
+        for rel in rels:
+            parent = rel.referenced_table
+            parent_pk_columns = parent.primary_key.columns if parent.primary_key else []
+            fk_join = " AND ".join(
+                f"c.[{fk_col.column_name}] = p.[{ref_col.column_name}]"
+                for fk_col, ref_col in zip(rel.parent_columns, rel.referenced_columns, strict=True)
+            )
+            pk_join = " AND ".join(
+                f"p.[{col.column_name}] = tp.[{col.column_name}]" for col in parent_pk_columns
+            )
+            branches.append(
+                f"FROM {table.full_table_name()} AS c "
+                f"INNER JOIN {parent.full_table_name()} AS p ON {fk_join} "
+                f"INNER JOIN {temp_names[parent.key]} AS tp ON {pk_join}"
+            )
+
+        # INTO goes on the first branch; UNION removes duplicates across branches, and a
+        # single branch only needs DISTINCT when its FK doesn't reference the parent PK
+        first, *rest = branches
+        union_sql = "".join(f" UNION SELECT {pk_select} {branch}" for branch in rest)
+        parent_pk = rels[0].referenced_table.primary_key
+        distinct = ""
+        if not rest and not (parent_pk and parent_pk.is_unique_over(rels[0].referenced_columns)):
+            distinct = "DISTINCT "
+        statements.append(f"SELECT {distinct}{pk_select} INTO {temp_name} {first}{union_sql};")
+
+    statements.extend(f"SELECT * FROM {temp_names[key]};" for key in order)
+    # Pooled connections keep their session, so the temp tables must not outlive the batch
+    statements.extend(f"DROP TABLE {temp_names[key]};" for key in order)
+    return "\n".join(statements), [(tables[key], levels[key]) for key in order]
+
+
+def _run_server_side_cascade(
+    service: MetadataService,
+    hierarchy: Hierarchy,
+    root_table: DbTable,
+    queue: ProcessingQueue,
+    config: CleanupConfig,
+) -> Optional[int]:
+    """
+    Resolve the cascade with a single batch and record every table in the queue as completed.
+    Returns the number of relationships that found records, or None to fall back to the
+    breadth-first cascade.
+    """
+    root_task = queue.get_task(root_table.key)
+    if root_task is None or not config.server_side_cascade:
+        return None
+    # The root IDs are inlined into the batch, so sets large enough to need batching
+    # go through the breadth-first cascade, which batches them
+    if config.batch_threshold > 0 and len(root_task.ids) >= config.batch_threshold:
+        return None
+
+    cascade_batch = _build_cascade_batch(hierarchy, root_table, root_task.ids)
+    if cascade_batch is None:
+        return None
+    sql, table_levels = cascade_batch
+
+    results: Dict[str, Set[Any]] = {}
+    with service.connection.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql)
+            for table, _ in table_levels:
+                rows = _iter_rows(cursor, config.fetch_array_size)
+                if table.primary_key and len(table.primary_key.columns) == 1:
+                    results[table.key] = {row[0] for row in rows}
                 else:
-                    conditions.append(f"[{col_name}] = {val}")
+                    results[table.key] = {tuple(row) for row in rows}
+                cursor.nextset()
+        except Exception as e:
+            console.print(f"[yellow]Server-side cascade failed, falling back: {e}[/]")
+            return None
 
-            if conditions:
-                where_clauses.append(f"({' AND '.join(conditions)})")
+    for table, level in table_levels:
+        if table.key != root_table.key and results[table.key]:
+            queue.add_task(table, results[table.key], level=level)
+            console.print(f"  → {table.table_name}: {len(results[table.key]):,} records")
+        if queue.get_task(table.key):
+            queue.mark_completed(table.key)
 
-        return " OR ".join(where_clauses) if where_clauses else "1=0"
+    return sum(1 for rel in hierarchy.relationships if results[rel.parent_table.key])
 
 
-def find_child_primary_keys(
+def _find_child_pks_joined(
     service: MetadataService,
     child_table: DbTable,
-    foreign_key_columns: List[DbColumn],
-    referenced_values: List[tuple[Any, ...]],
+    relationships: List[Relationship],
+    parent_ids: Set[Any],
     config: CleanupConfig,
 ) -> Set[Any]:
-    """Find primary key values of child records that match the referenced values via foreign key"""
-    if not child_table.primary_key or not child_table.primary_key.columns:
-        console.print(
-            f"[yellow]No primary key found for {escape(child_table.full_table_name())}[/]"
-        )
-        return set()
+    """
+    Find child primary key values for every relationship from one parent to one child table.
+    The child is joined to the parent rows on the server, one UNION branch per relationship,
+    so sibling FKs cost a single round-trip and no referenced values are shipped back.
+    """
+    parent_table = relationships[0].referenced_table
+    parent_pk_columns = parent_table.primary_key.columns if parent_table.primary_key else []
+    child_pk_columns = child_table.primary_key.columns if child_table.primary_key else []
+    for table, pk_columns in ((parent_table, parent_pk_columns), (child_table, child_pk_columns)):
+        if not pk_columns:
+            console.print(f"[yellow]No primary key found for {escape(table.full_table_name())}[/]")
+            return set()
+
+    if config.use_temp_id_tables:
+        try:
+            return _find_child_pks_with_temp_ids(
+                service, child_table, child_pk_columns, relationships, parent_ids, config
+            )
+        except Exception as e:
+            # An empty result here would silently drop the child's deletes from the plan
+            console.print(f"[yellow]Temp ID table lookup failed, using inline IDs: {e}[/]")
+
+    return _find_child_pks_inline(
+        service, child_table, parent_pk_columns, child_pk_columns, relationships, parent_ids, config
+    )
+
 
-    # Check if we should use batching
-    if config.batch_threshold > 0 and len(referenced_values) >= config.batch_threshold:
-        console.print(f"      Using batched child processing for {len(referenced_values)} values")
-        return _process_child_records_in_batches(
-            service, child_table, foreign_key_columns, referenced_values, config.batch_size
+def _find_child_pks_inline(
+    service: MetadataService,
+    child_table: DbTable,
+    parent_pk_columns: List[DbColumn],
+    child_pk_columns: List[DbColumn],
+    relationships: List[Relationship],
+    parent_ids: Set[Any],
+    config: CleanupConfig,
+) -> Set[Any]:
+    """Find child primary key values with the parent IDs inlined, batched by batch_size"""
+    id_list = list(parent_ids)
+    batch_size = len(id_list)
+    if config.batch_threshold > 0 and len(id_list) >= config.batch_threshold:
+        console.print(f"      Using batched processing for {len(id_list)} IDs")
+        batch_size = config.batch_size
+
+    child_pk_values: Set[Any] = set()
+    for i in range(0, len(id_list), batch_size):
+        parent_filter = _build_pk_where_clause(parent_pk_columns, set(id_list[i : i + batch_size]))
+        query = _build_joined_child_pk_query(
+            child_table, child_pk_columns, relationships, f"WHERE {parent_filter}"
         )
-    else:
-        # Single query for smaller datasets
-        return _find_child_primary_keys_single_query(
-            service, child_table, foreign_key_columns, referenced_values
+        child_pk_values.update(
+            _execute_child_pk_query(service, query, len(child_pk_columns), config.fetch_array_size)
         )
 
+    return child_pk_values
 
-def _find_child_primary_keys_single_query(
+
+def _find_child_pks_with_temp_ids(
     service: MetadataService,
     child_table: DbTable,
-    foreign_key_columns: List[DbColumn],
-    referenced_values: List[tuple[Any, ...]],
+    child_pk_columns: List[DbColumn],
+    relationships: List[Relationship],
+    parent_ids: Set[Any],
+    config: CleanupConfig,
 ) -> Set[Any]:
-    """Find child primary key values using a single query"""
-    if not child_table.primary_key or not child_table.primary_key.columns:
-        return set()
+    """
+    Find child primary key values by joining to a temp table of parent IDs.
+    The IDs are bound through a bulk insert rather than inlined, so the query text and its
+    plan are the same for every call and no batching is needed. Errors are raised so the
+    caller can fall back to inline IDs.
+    """
+    parent_table = relationships[0].referenced_table
+    parent_pk_columns = parent_table.primary_key.columns if parent_table.primary_key else []
 
-    pk_columns = child_table.primary_key.columns
+    with service.connection.get_connection() as conn:
+        cursor = conn.cursor()
+        id_table = "#ids_parent"
+        try:
+            _populate_temp_id_table(cursor, id_table, parent_table, parent_pk_columns, parent_ids)
+            id_join = " AND ".join(
+                f"pr.[{col.column_name}] = ids.[{col.column_name}]" for col in parent_pk_columns
+            )
+            query = _build_joined_child_pk_query(
+                child_table,
+                child_pk_columns,
+                relationships,
+                f"INNER JOIN {id_table} AS ids ON {id_join}",
+            )
+            cursor.execute(query)
+            rows = _iter_rows(cursor, config.fetch_array_size)
+            if len(child_pk_columns) == 1:
+                return {row[0] for row in rows}
+            return {tuple(row) for row in rows}
+        finally:
+            # Pooled sessions outlive this call, so the temp table must not leak into them
+            cursor.execute(_drop_temp_table_sql(id_table))
 
-    # Build SELECT clause for primary key columns
-    if len(pk_columns) == 1:
-        # Single column PK
-        pk_select = f"[{pk_columns[0].column_name}]"
-    else:
-        # Multi-column PK
-        pk_select = ", ".join([f"[{col.column_name}]" for col in pk_columns])
 
-    where_clause = build_fk_where_clause(foreign_key_columns, referenced_values)
+def _drop_temp_table_sql(id_table: str) -> str:
+    """Return a statement dropping a temp table if it exists"""
+    return f"IF OBJECT_ID('tempdb..{id_table}') IS NOT NULL DROP TABLE {id_table}"
+
+
+def _populate_temp_id_table(
+    cursor: Any, id_table: str, table: DbTable, pk_columns: List[DbColumn], ids: Set[Any]
+) -> None:
+    """Create a temp table shaped like the table's PK and bulk-insert the IDs"""
+    columns_sql = ", ".join(f"[{col.column_name}]" for col in pk_columns)
+    # Clear a table a failed earlier call may have left on a reused session
+    cursor.execute(_drop_temp_table_sql(id_table))
+    cursor.execute(create_temp_id_table_sql(id_table, table, pk_columns))
+
+    rows = list(ids) if len(pk_columns) > 1 else [(value,) for value in ids]
+    placeholders = ", ".join("?" for _ in pk_columns)
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+    cursor.executemany(f"INSERT INTO {id_table} ({columns_sql}) VALUES ({placeholders})", rows)
+
 
-    if where_clause == "1=0":  # No valid conditions
-        console.print("No valid WHERE conditions generated")
-        return set()
+def _build_joined_child_pk_query(
+    child_table: DbTable,
+    child_pk_columns: List[DbColumn],
+    relationships: List[Relationship],
+    parent_filter_sql: str,
+) -> str:
+    """
+    Build the joined child primary key query.
+    parent_filter_sql restricts the parent table (aliased pr) to the parent rows, either
+    with a WHERE clause or a join to an ID table.
+    """
+    parent_table = relationships[0].referenced_table
+
+    # Only the columns the joins need are carried through the CTE
+    ref_columns = dict.fromkeys(
+        col.column_name for rel in relationships for col in rel.referenced_columns
+    )
+    ref_columns_sql = ", ".join(f"pr.[{col}]" for col in ref_columns)
+
+    pk_select = ", ".join(f"c.[{col.column_name}]" for col in child_pk_columns)
+    # A single branch has no UNION to remove duplicates, so it needs DISTINCT instead,
+    # unless each child row can join at most one parent row (the FK references the parent PK)
+    distinct = ""
+    if len(relationships) == 1 and not (
+        parent_table.primary_key
+        and parent_table.primary_key.is_unique_over(relationships[0].referenced_columns)
+    ):
+        distinct = "DISTINCT "
+    branches = []
+    for rel in relationships:
+        join_conditions = " AND ".join(
+            f"c.[{fk_col.column_name}] = p.[{ref_col.column_name}]"
+            for fk_col, ref_col in zip(rel.parent_columns, rel.referenced_columns, strict=True)
+        )
+        branches.append(
+            f"SELECT {distinct}{pk_select}\n"
+            f"    FROM {child_table.full_table_name()} AS c\n"
+            f"    INNER JOIN parent_rows AS p ON {join_conditions}"
+        )
+    union_sql = "\n    UNION\n    ".join(branches)
 
-    query = f"""
-    SELECT DISTINCT {pk_select}
-    FROM [{child_table.schema_name}].[{child_table.table_name}]
-    WHERE {where_clause}
+    return f"""
+    WITH parent_rows AS (
+        SELECT {ref_columns_sql}
+        FROM {parent_table.full_table_name()} AS pr
+        {parent_filter_sql}
+    )
+    {union_sql}
     """
 
-    child_pk_values = set()
+
+def _execute_child_pk_query(
+    service: MetadataService,
+    query: str,
+    pk_column_count: int,
+    array_size: int = DEFAULT_FETCH_ARRAY_SIZE,
+) -> Set[Any]:
+    """Execute a query returning child primary key columns"""
+    child_pk_values: Set[Any] = set()
     with service.connection.get_connection() as conn:
         cursor = conn.cursor()
         try:
             cursor.execute(query)
-            rows = cursor.fetchall()
+            rows = _iter_rows(cursor, array_size)
 
-            if len(pk_columns) == 1:
+            if pk_column_count == 1:
                 # Single column PK - store as individual values
                 child_pk_values = {row[0] for row in rows}
             else:
@@ -279,141 +527,67 @@ def _find_child_primary_keys_single_query(
     return child_pk_values
 
 
-def build_fk_where_clause(
-    foreign_key_columns: List[DbColumn], referenced_values: List[tuple[Any, ...]]
-) -> str:
-    """Build WHERE clause for foreign key matching"""
-    if len(foreign_key_columns) == 1:
-        # Single column FK - use IN clause
-        fk_column = foreign_key_columns[0].column_name
-        single_values = {val[0] for val in referenced_values}
-        id_list = format_id_list_for_sql(single_values)
-        return f"[{fk_column}] IN ({id_list})"
-
-    # Multi-column FK - build OR conditions
-    where_clauses = []
-    for ref_tuple in referenced_values:
-        conditions = []
-        for i, fk_col in enumerate(foreign_key_columns):
-            if i >= len(ref_tuple):
-                break
-
-            val = ref_tuple[i]
-            col_name = fk_col.column_name
-
-            if val is None:
-                conditions.append(f"[{col_name}] IS NULL")
-            elif isinstance(val, str):
-                val_escaped = val.replace("'", "''")
-                conditions.append(f"[{col_name}] = '{val_escaped}'")
-            else:
-                conditions.append(f"[{col_name}] = {val}")
-
-        if conditions:
-            where_clauses.append(f"({' AND '.join(conditions)})")
-
-    return " OR ".join(where_clauses) if where_clauses else "1=0"
-
-
-def _process_referenced_values_in_batches(
-    service: MetadataService,
-    parent_table: DbTable,
-    parent_ids: Set[Any],
-    ref_columns_sql: str,
-    pk_columns: List[DbColumn],
-    batch_size: int,
-) -> List[tuple[Any, ...]]:
-    """Process parent IDs in batches to avoid large WHERE clauses"""
-    all_results = []
-    id_list = list(parent_ids)
-    total_batches = (len(id_list) + batch_size - 1) // batch_size
+@lru_cache(maxsize=256)
+def _in_clause_template(column_name: str) -> Tuple[str, str]:
+    """Return the text before and after the value list of a single-column IN clause"""
+    return f"[{column_name}] IN (", ")"
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold magenta]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing referenced value batches...", total=total_batches)
 
-        for i in range(0, len(id_list), batch_size):
-            batch = id_list[i : i + batch_size]
-            where_clause = _build_pk_where_clause(pk_columns, set(batch))
-
-            query = f"""
-            SELECT DISTINCT {ref_columns_sql}
-            FROM [{parent_table.schema_name}].[{parent_table.table_name}]
-            WHERE {where_clause}
-            """
-
-            batch_results = _execute_referenced_values_query(service, query)
-            all_results.extend(batch_results)
-
-            batch_num = i // batch_size + 1
-            progress.update(
-                task,
-                description=f"Batch {batch_num}/{total_batches}: Found {len(batch_results)} values",
-                advance=1,
-            )
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_results = []
-    for item in all_results:
-        if item not in seen:
-            seen.add(item)
-            unique_results.append(item)
+@lru_cache(maxsize=256)
+def _values_join_template(column_names: Tuple[str, ...]) -> Tuple[str, str]:
+    """Return the text before and after the row list of a multi-column VALUES semi-join"""
+    # VALUES columns are positional (c0, c1, ...) so unqualified names bind to the outer table
+    alias_columns = ", ".join(f"c{i}" for i in range(len(column_names)))
+    join_conditions = " AND ".join(f"[{name}] = v.c{i}" for i, name in enumerate(column_names))
+    return (
+        "EXISTS (SELECT 1 FROM (VALUES (",
+        f")) AS v({alias_columns}) WHERE {join_conditions})",
+    )
 
-    return unique_results
 
+def _build_pk_where_clause(pk_columns: List[DbColumn], pk_values: Set[Any]) -> str:
+    """Build WHERE clause for primary key matching"""
+    if len(pk_columns) == 1:
+        # Single column PK - use IN clause
+        prefix, suffix = _in_clause_template(pk_columns[0].column_name)
+        return prefix + format_id_list_for_sql(pk_values) + suffix
 
-def _process_child_records_in_batches(
-    service: MetadataService,
-    child_table: DbTable,
-    foreign_key_columns: List[DbColumn],
-    referenced_values: List[tuple[Any, ...]],
-    batch_size: int,
-) -> Set[Any]:
-    """Process referenced values in batches to find child primary keys"""
-    all_child_pk_values = set()
-    total_batches = (len(referenced_values) + batch_size - 1) // batch_size
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold magenta]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing child record batches...", total=total_batches)
-
-        for i in range(0, len(referenced_values), batch_size):
-            batch = referenced_values[i : i + batch_size]
-            batch_child_values = _find_child_primary_keys_single_query(
-                service, child_table, foreign_key_columns, batch
-            )
-            all_child_pk_values.update(batch_child_values)
+    # Multi-column PK - semi-join against a VALUES table
+    return _build_values_join_clause(pk_columns, pk_values)
 
-            batch_num = i // batch_size + 1
-            progress.update(
-                task,
-                description=(
-                    f"Batch {batch_num}/{total_batches}: Found {len(batch_child_values)} child PKs"
-                ),
-                advance=1,
-            )
 
-    return all_child_pk_values
+def _build_values_join_clause(columns: List[DbColumn], value_tuples: Collection[Any]) -> str:
+    """
+    Build a WHERE condition matching rows whose columns equal any of the given tuples.
+    Complete tuples are semi-joined against one VALUES table, which SQL Server can answer
+    with an index join instead of a long OR chain. Tuples containing NULLs can't match
+    by equality and fall back to AND/IS NULL conditions.
+    """
+    # Handle case where a tuple might be a single value
+    rows = [t if isinstance(t, (tuple, list)) else (t,) for t in value_tuples]
+    complete_rows = [row for row in rows if len(row) >= len(columns) and None not in row]
+    partial_rows = [row for row in rows if len(row) < len(columns) or None in row]
 
+    where_clauses = []
+    if complete_rows:
+        literal_columns = [
+            format_sql_literals([row[i] for row in complete_rows]) for i in range(len(columns))
+        ]
+        values_sql = "), (".join(map(", ".join, zip(*literal_columns, strict=True)))
+        prefix, suffix = _values_join_template(tuple(col.column_name for col in columns))
+        where_clauses.append(prefix + values_sql + suffix)
+
+    for row in partial_rows:
+        conditions = []
+        for col, val in zip(columns, row, strict=False):
+            if val is None:
+                conditions.append(f"[{col.column_name}] IS NULL")
+            else:
+                conditions.append(f"[{col.column_name}] = {format_sql_literal(val)}")
+        if conditions:
+            where_clauses.append(f"({' AND '.join(conditions)})")
 
-def _execute_referenced_values_query(service: MetadataService, query: str) -> List[tuple[Any, ...]]:
-    """Execute a query to get referenced column values"""
-    result_values = []
-    with service.connection.get_connection() as conn:
-        cursor = conn.cursor()
-        try:
-            cursor.execute(query)
-            result_values = [tuple(row) for row in cursor.fetchall()]
-        except Exception as e:
-            console.print(f"[yellow]Error getting referenced values: {e}[/]")
-    return result_values
+    return " OR ".join(where_clauses) if where_clauses else "1=0"
 
 
 def _capture_fk_constraints_for_disabling(
@@ -440,46 +614,46 @@ def _capture_fk_constraints_for_disabling(
     return constraints_captured
 
 
+# Relationship graphs already completed by discovery, keyed by (server, database)
+_discovered_graphs: Dict[Tuple[str, str], FrozenSet[Tuple[str, str, str]]] = {}
+
+
+def _relationship_signature(hierarchy: Hierarchy) -> FrozenSet[Tuple[str, str, str]]:
+    """Identify a hierarchy's relationship graph by its (parent, referenced, FK name) keys"""
+    return frozenset(
+        (rel.parent_table.key, rel.referenced_table.key, rel.name)
+        for rel in hierarchy.relationships
+    )
+
+
 def _discover_additional_relationships(hierarchy: Hierarchy, all_tables: set[DbTable]) -> None:
     """Discover additional relationships not captured in initial hierarchy"""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold magenta]{task.description}"),
-        console=console,
-    ) as progress:
+    with create_progress() as progress:
         task = progress.add_task("Discovering additional relationships...", total=len(all_tables))
 
         additional_relationships = []
-        tables_in_hierarchy = {f"{t.schema_name}.{t.table_name}" for t in all_tables}
+        # Index tables and existing relationships once so each FK is a pair of dict lookups
+        table_index = {t.key: t for t in all_tables}
+        existing_relationships = set(_relationship_signature(hierarchy))
 
         for table in all_tables:
             for fk_name, fk in table.foreign_keys.items():
-                referenced_table_key = f"{fk.referenced_schema}.{fk.referenced_table}"
-
                 # Check if this FK references a table in our hierarchy
-                if referenced_table_key in tables_in_hierarchy:
-                    referenced_table_obj = next(
-                        (
-                            t
-                            for t in all_tables
-                            if t.schema_name == fk.referenced_schema
-                            and t.table_name == fk.referenced_table
-                        ),
-                        None,
+                referenced_table_key = f"{fk.referenced_schema}.{fk.referenced_table}"
+                referenced_table_obj = table_index.get(referenced_table_key)
+                relationship_key = (table.key, referenced_table_key, fk_name)
+
+                if referenced_table_obj and relationship_key not in existing_relationships:
+                    existing_relationships.add(relationship_key)
+                    new_rel = Relationship(
+                        name=fk_name,
+                        parent_table=table,
+                        parent_columns=fk.parent_columns,
+                        referenced_table=referenced_table_obj,
+                        referenced_columns=fk.referenced_columns,
                     )
-
-                    if referenced_table_obj and not _relationship_exists(
-                        hierarchy, table, referenced_table_obj, fk_name
-                    ):
-                        new_rel = Relationship(
-                            name=fk_name,
-                            parent_table=table,
-                            parent_columns=fk.parent_columns,
-                            referenced_table=referenced_table_obj,
-                            referenced_columns=fk.referenced_columns,
-                        )
-                        additional_relationships.append(new_rel)
-                        console.print(f"  Found additional FK: {fk_name}")
+                    additional_relationships.append(new_rel)
+                    console.print(f"  Found additional FK: {fk_name}")
             progress.advance(task)
         progress.update(task, description="✓ Relationship discovery complete")
 
@@ -504,20 +678,21 @@ def preload_all_foreign_keys(
     tables_loaded = 0
     constraints_captured = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold magenta]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Loading foreign keys...", total=len(all_tables))
-
+    with create_progress() as progress:
         tables_needing_fks = [table for table in all_tables if not table.foreign_keys]
-        for table in tables_needing_fks:
-            if not table.foreign_keys:
-                service.get_foreign_keys(table)
+        task = progress.add_task("Loading foreign keys...", total=len(tables_needing_fks))
+        # Refresh the display about 100 times in total rather than once per table
+        update_every = max(1, len(tables_needing_fks) // 100)
+
+        # Each lookup opens its own connection, so the I/O-bound queries can overlap
+        with ThreadPoolExecutor(max_workers=config.parallelism) as executor:
+            futures = [executor.submit(service.get_foreign_keys, t) for t in tables_needing_fks]
+            for future in as_completed(futures):
+                future.result()
                 tables_loaded += 1
-                progress.update(task, advance=1)
-            progress.advance(task)
+                if tables_loaded % update_every == 0:
+                    progress.update(task, completed=tables_loaded)
+        progress.update(task, completed=tables_loaded)
 
         # Capture constraint information for tables configured for FK disabling
         # This must be done after all FKs are loaded
@@ -534,8 +709,14 @@ def preload_all_foreign_keys(
         else:
             progress.update(task, description=f"✓ Loaded foreign keys for {tables_loaded} tables")
 
-    # Discover additional relationships not captured in initial hierarchy
-    _discover_additional_relationships(hierarchy, all_tables)
+    # Discover additional relationships not captured in initial hierarchy, unless no new FK
+    # metadata was loaded and this exact relationship graph was already discovered
+    graph_key = (service.connection.server, service.connection.database)
+    if tables_loaded or _relationship_signature(hierarchy) != _discovered_graphs.get(graph_key):
+        _discover_additional_relationships(hierarchy, all_tables)
+        _discovered_graphs[graph_key] = _relationship_signature(hierarchy)
+    else:
+        console.print("[dim]Relationship graph unchanged, skipping discovery[/]")
 
     hierarchy.rebuild_table_levels()
 
@@ -552,141 +733,168 @@ def preload_all_foreign_keys(
     return constraint_manager
 
 
-def _relationship_exists(
-    hierarchy: Hierarchy, parent_table: DbTable, referenced_table: DbTable, fk_name: str
-) -> bool:
-    """Check if a relationship already exists in the hierarchy"""
-    return any(
-        (
-            rel.parent_table.schema_name == parent_table.schema_name
-            and rel.parent_table.table_name == parent_table.table_name
-            and rel.referenced_table.schema_name == referenced_table.schema_name
-            and rel.referenced_table.table_name == referenced_table.table_name
-            and rel.name == fk_name
-        )
-        for rel in hierarchy.relationships
-    )
-
-
-def _add_fk_disable_section(
-    script_lines: List[str], fk_constraint_manager: ForeignKeyConstraintManager
-) -> None:
-    """Add foreign key disable section to script"""
+def _iter_fk_disable_section(fk_constraint_manager: ForeignKeyConstraintManager) -> Iterator[str]:
+    """Yield the foreign key disable section of the script"""
     if fk_constraint_manager.constraint_count > 0:
-        script_lines.append("-- =================================================================")
-        script_lines.append("-- DISABLE FOREIGN KEY CONSTRAINTS")
-        script_lines.append("-- =================================================================")
+        yield "-- ================================================================="
+        yield "-- DISABLE FOREIGN KEY CONSTRAINTS"
+        yield "-- ================================================================="
         disable_statements = fk_constraint_manager.generate_disable_all_sql()
         for stmt in disable_statements:
-            script_lines.append(stmt + ";")
-        script_lines.append("")
+            yield stmt + ";"
+        yield ""
 
 
-def _add_fk_enable_section(
-    script_lines: List[str], fk_constraint_manager: ForeignKeyConstraintManager
-) -> None:
-    """Add foreign key re-enable section to script"""
+def _iter_fk_enable_section(fk_constraint_manager: ForeignKeyConstraintManager) -> Iterator[str]:
+    """Yield the foreign key re-enable section of the script"""
     if fk_constraint_manager.constraint_count > 0:
-        script_lines.append("-- =================================================================")
-        script_lines.append("-- RE-ENABLE AND VALIDATE FOREIGN KEY CONSTRAINTS")
-        script_lines.append("-- =================================================================")
+        yield "-- ================================================================="
+        yield "-- RE-ENABLE AND VALIDATE FOREIGN KEY CONSTRAINTS"
+        yield "-- ================================================================="
         enable_statements = fk_constraint_manager.generate_enable_all_sql()
         for stmt in enable_statements:
-            script_lines.append(stmt + ";")
-        script_lines.append("")
+            yield stmt + ";"
+        yield ""
+
+
+def _iter_batched_delete_section(
+    operation: CleanupOperation, batch_size: int, use_temp_id_tables: bool = False
+) -> Iterator[str]:
+    """Yield the batched DELETE statements for one table, each with a batch header"""
+    if use_temp_id_tables:
+        yield "-- IDs are loaded into a temp table and deleted with a single join"
+        for stmt in operation.iter_temp_table_delete_sql(batch_size):
+            yield stmt + ";"
+        return
 
+    record_count = len(operation.ids)
+    batch_count = (record_count + batch_size - 1) // batch_size
+    yield f"-- Using {batch_count} batches of max {batch_size} records each"
 
-def generate_cleanup_script(
+    delete_statements = operation.iter_batched_delete_sql(batch_size)
+    for i, stmt in enumerate(delete_statements):
+        start_idx = i * batch_size + 1
+        end_idx = min((i + 1) * batch_size, record_count)
+        yield f"-- Batch {i + 1}/{batch_count}: records {start_idx}-{end_idx}"
+        yield stmt + ";"
+
+
+def iter_cleanup_script(
     operations: Dict[str, CleanupOperation],
     deletion_order: List[DbTable],
     config: CleanupConfig,
     fk_constraint_manager: ForeignKeyConstraintManager,
-) -> str:
-    """Generate a SQL script for cleanup operations"""
-    script_lines = []
-    script_lines.append("-- Data Cleanup Script")
-    script_lines.append(f"-- Connection: {config.connection.server}")
-    script_lines.append(f"-- Database: {config.database}")
-    script_lines.append(f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    bulk_deletes: Optional[Dict[str, str]] = None,
+) -> Iterator[str]:
+    """Yield the lines of a SQL script for cleanup operations, without line terminators"""
+    bulk_deletes = bulk_deletes or {}
+
+    yield "-- Data Cleanup Script"
+    yield f"-- Connection: {config.connection.server}"
+    yield f"-- Database: {config.database}"
+    yield f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
     if config.batch_threshold > 0:
-        script_lines.append("-- Batch Processing: Enabled")
-        script_lines.append(f"-- Batch Size: {config.batch_size} records")
-        script_lines.append(f"-- Batch Threshold: {config.batch_threshold} records")
+        yield "-- Batch Processing: Enabled"
+        yield f"-- Batch Size: {config.batch_size} records"
+        yield f"-- Batch Threshold: {config.batch_threshold} records"
     else:
-        script_lines.append("-- Batch Processing: Disabled")
+        yield "-- Batch Processing: Disabled"
 
     # Add FK constraint information to header
     if fk_constraint_manager.constraint_count > 0:
-        script_lines.append("-- Foreign Key Management: Enabled")
-        script_lines.append(f"-- Constraints to disable: {fk_constraint_manager.constraint_count}")
+        yield "-- Foreign Key Management: Enabled"
+        yield f"-- Constraints to disable: {fk_constraint_manager.constraint_count}"
         affected_tables = ", ".join(sorted(fk_constraint_manager.affected_tables))
-        script_lines.append(f"-- Affected tables: {affected_tables}")
+        yield f"-- Affected tables: {affected_tables}"
     else:
-        script_lines.append("-- Foreign Key Management: None")
+        yield "-- Foreign Key Management: None"
 
-    script_lines.append("\nBEGIN TRANSACTION;\n")
+    yield "\nBEGIN TRANSACTION;\n"
 
     # Disable foreign key constraints if any are configured
-    _add_fk_disable_section(script_lines, fk_constraint_manager)
+    yield from _iter_fk_disable_section(fk_constraint_manager)
 
     total_records = 0
     batched_tables = 0
 
     # Process tables in deletion order
     for table in deletion_order:
-        table_key = f"{table.schema_name}.{table.table_name}"
+        table_key = table.key
 
         if table_key in operations and operations[table_key].ids:
             operation = operations[table_key]
             record_count = len(operation.ids)
             total_records += record_count
 
-            script_lines.append(f"-- Table: {table_key}")
-            script_lines.append(f"-- Records to delete: {record_count}")
+            yield f"-- Table: {table_key}"
+            yield f"-- Records to delete: {record_count}"
 
             # Determine if batching should be used
             use_batching = operation.should_use_batching(config.batch_threshold)
 
-            if use_batching:
+            if table_key in bulk_deletes:
+                yield "-- Every row is being removed, so the table is truncated"
+                yield bulk_deletes[table_key] + ";"
+            elif use_batching:
                 batched_tables += 1
-                batch_count = (record_count + config.batch_size - 1) // config.batch_size
-                script_lines.append(
-                    f"-- Using {batch_count} batches of max {config.batch_size} records each"
+                yield from _iter_batched_delete_section(
+                    operation, config.batch_size, config.use_temp_id_tables
                 )
-
-                delete_statements = operation.generate_batched_delete_sql(config.batch_size)
-                for i, stmt in enumerate(delete_statements):
-                    start_idx = i * config.batch_size + 1
-                    end_idx = min((i + 1) * config.batch_size, record_count)
-                    script_lines.append(
-                        f"-- Batch {i + 1}/{batch_count}: records {start_idx}-{end_idx}"
-                    )
-                    script_lines.append(stmt + ";")
             else:
                 delete_sql = operation.generate_delete_sql()
                 if delete_sql:
-                    script_lines.append(delete_sql + ";")
+                    yield delete_sql + ";"
 
-            script_lines.append("")
+            yield ""
 
     # Re-enable foreign key constraints if any were disabled
-    _add_fk_enable_section(script_lines, fk_constraint_manager)
+    yield from _iter_fk_enable_section(fk_constraint_manager)
 
-    script_lines.append(
-        f"-- Script Summary: {total_records} records across {len(operations)} tables"
-    )
+    yield f"-- Script Summary: {total_records} records across {len(operations)} tables"
     if batched_tables > 0:
-        script_lines.append(f"-- {batched_tables} tables processed with batching")
+        yield f"-- {batched_tables} tables processed with batching"
 
     if fk_constraint_manager.constraint_count > 0:
         constraint_count = fk_constraint_manager.constraint_count
-        script_lines.append(f"-- {constraint_count} foreign key constraints managed")
+        yield f"-- {constraint_count} foreign key constraints managed"
+
+    yield "\n-- COMMIT TRANSACTION;"
+    yield "-- ROLLBACK TRANSACTION;"
+
+
+def generate_cleanup_script(
+    operations: Dict[str, CleanupOperation],
+    deletion_order: List[DbTable],
+    config: CleanupConfig,
+    fk_constraint_manager: ForeignKeyConstraintManager,
+    bulk_deletes: Optional[Dict[str, str]] = None,
+) -> str:
+    """Generate a SQL script for cleanup operations"""
+    return "\n".join(
+        iter_cleanup_script(operations, deletion_order, config, fk_constraint_manager, bulk_deletes)
+    )
 
-    script_lines.append("\n-- COMMIT TRANSACTION;")
-    script_lines.append("-- ROLLBACK TRANSACTION;")
 
-    return "\n".join(script_lines)
+def find_bulk_deletes(
+    service: MetadataService, operations: Dict[str, CleanupOperation], config: CleanupConfig
+) -> Dict[str, str]:
+    """Find large operations that remove every row of their table and can be truncated"""
+    bulk_deletes: Dict[str, str] = {}
+    # TRUNCATE is opt-in, since it needs ALTER permission on the table rather than DELETE
+    if config.truncate_threshold <= 0:
+        return bulk_deletes
+
+    for table_key, operation in operations.items():
+        # Small tables gain little, so only pay for the metadata checks on large ones
+        if len(operation.ids) < config.truncate_threshold:
+            continue
+
+        bulk_delete = operation.try_emit_bulk_delete(service)
+        if bulk_delete:
+            bulk_deletes[table_key] = bulk_delete
+
+    return bulk_deletes
 
 
 def display_hierarchy_summary(
@@ -714,7 +922,7 @@ def display_hierarchy_summary(
 
     tables_with_records = []
     for i, table in enumerate(deletion_order):
-        table_key = f"{table.schema_name}.{table.table_name}"
+        table_key = table.key
         if table_key in operations and operations[table_key].ids:
             count = len(operations[table_key].ids)
             tables_with_records.append((i + 1, table_key, count))
@@ -733,10 +941,60 @@ def display_hierarchy_summary(
     console.print(f"[bold]Total records to delete: {total_records}[/]")
 
 
+def _supports_openjson(cursor: Any) -> bool:
+    """Whether the connected database's compatibility level (130+) allows OPENJSON"""
+    try:
+        cursor.execute("SELECT compatibility_level FROM sys.databases WHERE name = DB_NAME()")
+        row = cursor.fetchone()
+    except Exception:
+        return False
+    return row is not None and row[0] is not None and int(row[0]) >= 130
+
+
+def _delete_operation_rows(
+    cursor: Any,
+    operation: CleanupOperation,
+    batch_size: int,
+    use_temp_id_tables: bool = False,
+    json_params: bool = False,
+) -> int:
+    """Run the batched DELETEs for one operation and return the number of rows deleted"""
+    pk = operation.table.primary_key
+    if use_temp_id_tables and pk and pk.columns:
+        # One bulk insert of the IDs and one joined DELETE, instead of a DELETE per batch
+        id_table = "#ids_delete"
+        _populate_temp_id_table(cursor, id_table, operation.table, pk.columns, operation.ids)
+        cursor.execute(operation.generate_join_delete_sql(id_table))
+        deleted: int = cursor.rowcount
+        cursor.execute(f"DROP TABLE {id_table}")
+        return deleted
+
+    deleted_rows = 0
+    if json_params and operation.can_bind_ids_as_json():
+        # IDs are bound as JSON parameters so every batch reuses the same plan
+        for delete_sql, params in operation.iter_parameterized_deletes(batch_size):
+            cursor.execute(delete_sql, params)
+            deleted_rows += cursor.rowcount
+        return deleted_rows
+
+    # Literal IN lists work at any compatibility level and for every key type
+    for delete_sql in operation.iter_batched_delete_sql(batch_size):
+        cursor.execute(delete_sql)
+        deleted_rows += cursor.rowcount
+    return deleted_rows
+
+
 def execute_cleanup(
-    config: CleanupConfig, operations: Dict[str, CleanupOperation], deletion_order: List[DbTable]
+    config: CleanupConfig,
+    operations: Dict[str, CleanupOperation],
+    deletion_order: List[DbTable],
+    deletion_waves: Optional[List[List[DbTable]]] = None,
 ) -> None:
     """Execute the cleanup operations against the database"""
+    if config.max_parallel_deletes > 1 and deletion_waves is not None:
+        _execute_cleanup_in_waves(config, operations, deletion_waves)
+        return
+
     if not Confirm.ask("\nAre you sure you want to execute the cleanup operations?"):
         console.print("[yellow]Execution cancelled[/]")
         return
@@ -745,20 +1003,23 @@ def execute_cleanup(
 
     with config.connection.get_connection() as conn:
         cursor = conn.cursor()
+        json_params = _supports_openjson(cursor)
         try:
             cursor.execute("BEGIN TRANSACTION")
 
             for table in deletion_order:
-                table_key = f"{table.schema_name}.{table.table_name}"
+                table_key = table.key
 
                 if table_key in operations and operations[table_key].ids:
-                    operation = operations[table_key]
-                    delete_sql = operation.generate_delete_sql()
-
-                    if delete_sql:
-                        console.print(f"Deleting from {table_key}...")
-                        cursor.execute(delete_sql)
-                        console.print(f"[green]Deleted {cursor.rowcount} rows[/]")
+                    console.print(f"Deleting from {table_key}...")
+                    deleted_rows = _delete_operation_rows(
+                        cursor,
+                        operations[table_key],
+                        config.batch_size,
+                        config.use_temp_id_tables,
+                        json_params,
+                    )
+                    console.print(f"[green]Deleted {deleted_rows} rows[/]")
 
             if Confirm.ask("\nCommit the transaction?"):
                 cursor.execute("COMMIT TRANSACTION")
@@ -770,3 +1031,114 @@ def execute_cleanup(
         except Exception as e:
             cursor.execute("ROLLBACK TRANSACTION")
             console.print(f"[bold red]Error during execution. Transaction rolled back: {e}[/]")
+
+
+def _delete_table_from_pool(
+    pool: Queue[Any], operation: CleanupOperation, config: CleanupConfig, json_params: bool
+) -> int:
+    """Delete one operation's rows on a pooled connection and commit them"""
+    conn = pool.get()
+    try:
+        try:
+            deleted_rows = _delete_operation_rows(
+                conn.cursor(),
+                operation,
+                config.batch_size,
+                config.use_temp_id_tables,
+                json_params,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return deleted_rows
+    finally:
+        pool.put(conn)
+
+
+def _run_deletion_waves(
+    pool: Queue[Any],
+    operations: Dict[str, CleanupOperation],
+    deletion_waves: List[List[DbTable]],
+    config: CleanupConfig,
+    json_params: bool,
+) -> List[str]:
+    """Delete each wave's tables concurrently and return tables whose row counts differ"""
+    mismatched_tables: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=config.max_parallel_deletes) as executor:
+        for wave in deletion_waves:
+            futures = {
+                executor.submit(
+                    _delete_table_from_pool, pool, operations[t.key], config, json_params
+                ): t.key
+                for t in wave
+                if t.key in operations and operations[t.key].ids
+            }
+
+            # Every table in a wave must finish before the tables it references are deleted
+            for future in as_completed(futures):
+                table_key = futures[future]
+                deleted_rows = future.result()
+                console.print(f"[green]Deleted {deleted_rows} rows from {table_key}[/]")
+                if deleted_rows != len(operations[table_key].ids):
+                    mismatched_tables.append(table_key)
+
+    return mismatched_tables
+
+
+def _execute_cleanup_in_waves(
+    config: CleanupConfig,
+    operations: Dict[str, CleanupOperation],
+    deletion_waves: List[List[DbTable]],
+) -> None:
+    """
+    Execute the cleanup one wave at a time, deleting the tables of a wave concurrently.
+    Each table commits on its own connection, since a later wave's FK checks would block
+    on rows an earlier wave deleted but hadn't committed yet.
+    """
+    # There is no single transaction to confirm at the end, so warn before anything runs
+    console.print(
+        f"\n[bold yellow]Warning: max_parallel_deletes is {config.max_parallel_deletes}, so each "
+        "table is committed as soon as its rows are deleted and there is no final commit "
+        "prompt. A failure partway through leaves the tables deleted so far committed. "
+        "Set max_parallel_deletes = 1 to run the whole cleanup in one transaction.[/]"
+    )
+    if not Confirm.ask("Are you sure you want to execute the cleanup operations?"):
+        console.print("[yellow]Execution cancelled[/]")
+        return
+
+    console.print(
+        f"[bold]Executing cleanup operations with up to {config.max_parallel_deletes} "
+        "concurrent deletes...[/]"
+    )
+
+    pool: Queue[Any] = Queue()
+    connections: List[Any] = []
+    try:
+        for _ in range(config.max_parallel_deletes):
+            conn = config.connection.connect()
+            connections.append(conn)
+            pool.put(conn)
+
+        json_params = _supports_openjson(connections[0].cursor())
+        mismatched_tables = _run_deletion_waves(
+            pool, operations, deletion_waves, config, json_params
+        )
+
+        # Verification pass: every table should have lost exactly the rows that were found
+        if mismatched_tables:
+            console.print(
+                "[yellow]Deleted row counts differ from the records found for: "
+                f"{', '.join(mismatched_tables)}[/]"
+            )
+        console.print("[bold green]All deletes committed[/]")
+
+    except Exception as e:
+        console.print(
+            f"[bold red]Error during execution. Tables deleted in earlier waves remain "
+            f"committed: {e}[/]"
+        )
+    finally:
+        for conn in connections:
+            conn.close()
@@ -1,9 +1,16 @@
+import hashlib
+import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import psycopg2
+import pyarrow as pa
 import pyodbc
 from rich.pretty import Pretty
 from rich.table import Table
@@ -15,15 +22,30 @@ ConnectionType = Union[pyodbc.Connection, "psycopg2.extensions.connection"]
 CursorType = Union[pyodbc.Cursor, "psycopg2.extensions.cursor"]
 
 
+@lru_cache(maxsize=None)
+def _read_resolved_sql_file(resolved_path: str) -> str:
+    return Path(resolved_path).read_text(encoding="utf-8")
+
+
+def read_sql_file(file_path: str) -> str:
+    """Read a SQL file once per process; later references to the same file reuse the text"""
+    # Keyed by resolved path so equivalent relative and absolute paths share one entry
+    return _read_resolved_sql_file(str(Path(file_path).resolve()))
+
+
 @dataclass
 class QueryResult:
     """Contains the results and metadata from a query execution"""
 
     results: pd.DataFrame
     duration: float
+    # Set for streamed queries, whose results hold only the column schema
+    streamed_rows: Optional[int] = None
 
     @property
     def row_count(self) -> int:
+        if self.streamed_rows is not None:
+            return self.streamed_rows
         return len(self.results)
 
 
@@ -34,11 +56,16 @@ class ComparisonResult:
         self.left = left
         self.right = right
 
-        # Initialize variables
-        self.left_only = pd.DataFrame()
-        self.right_only = pd.DataFrame()
-        self.common_rows = pd.DataFrame()
-        self.is_equal = False
+        # Initialize variables; the row diff fills these in on first access
+        self._left_only = pd.DataFrame()
+        self._right_only = pd.DataFrame()
+        # Common rows are usually most of the result, so the hash diff keeps a mask over the
+        # sorted left frame and only filters it when common_rows is first read
+        self._common_source = pd.DataFrame()
+        self._common_mask: Optional[npt.NDArray[np.bool_]] = None
+        self._common_count = 0
+        self._is_equal = False
+        self._pending_diff: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
         self.row_count_match = self.left.row_count == self.right.row_count
         self.shape_match = False
         self.columns_match = False
@@ -46,16 +73,84 @@ class ComparisonResult:
         left_df = self.left.results.reset_index(drop=True)
         right_df = self.right.results.reset_index(drop=True)
 
+        # Lower-cased name -> original name, shared by every case-insensitive column check
+        self._left_columns = {col.lower(): col for col in left_df.columns}
+        self._right_columns = {col.lower(): col for col in right_df.columns}
+
+        # Shape and column checks are cheap, so only the row diff waits until it is needed
+        self.shape_match = left_df.shape == right_df.shape
+        self.columns_match = self._check_column_match()
+        if self.columns_match:
+            self._pending_diff = (left_df, right_df)
+
+    def compute_diff(self) -> None:
+        """Run the row diff now, if it has not run yet"""
+        if self._pending_diff is None:
+            return
+        left_df, right_df = self._pending_diff
+        self._pending_diff = None
         try:
-            self.shape_match = left_df.shape == right_df.shape
-            self.columns_match = self._check_column_match(left_df, right_df)
-
-            if self.columns_match:
-                self._compare_dataframes(left_df, right_df)
-
+            self._compare_dataframes(left_df, right_df)
         except Exception as e:
             console.print(f"[dim]Error during DataFrame comparison: {e}[/]")
 
+    @property
+    def left_only(self) -> pd.DataFrame:
+        """Rows only in the left result"""
+        self.compute_diff()
+        return self._left_only
+
+    @property
+    def right_only(self) -> pd.DataFrame:
+        """Rows only in the right result"""
+        self.compute_diff()
+        return self._right_only
+
+    @property
+    def common_rows(self) -> pd.DataFrame:
+        """Rows present in both results"""
+        self.compute_diff()
+        if self._common_mask is not None:
+            if not self._common_mask.all():
+                self._common_source = self._common_source[self._common_mask]
+            self._common_mask = None
+        return self._common_source
+
+    @property
+    def common_count(self) -> int:
+        """Number of left rows also present in the right result"""
+        self.compute_diff()
+        return self._common_count
+
+    @property
+    def is_equal(self) -> bool:
+        """Whether both results hold the same rows, with at least one row in common"""
+        self.compute_diff()
+        return self._is_equal
+
+    @classmethod
+    def from_streamed(
+        cls,
+        left: QueryResult,
+        right: QueryResult,
+        left_only: pd.DataFrame,
+        right_only: pd.DataFrame,
+        common_count: int,
+    ) -> "ComparisonResult":
+        """Build a result from a streamed comparison, which keeps no common rows"""
+        # Streamed results hold only the column schema, so the constructor's compare is cheap
+        result = cls(left, right)
+        result.shape_match = result.row_count_match and len(left.results.columns) == len(
+            right.results.columns
+        )
+        if result.columns_match:
+            result._pending_diff = None
+            result._left_only = left_only
+            result._right_only = right_only
+            result._common_count = common_count
+            result._is_equal = left_only.empty and right_only.empty and common_count > 0
+        return result
+
     def __str__(self) -> str:
         status = "EQUAL" if self.is_equal else "NOT EQUAL"
         return (
@@ -64,146 +159,215 @@ class ComparisonResult:
             f"Right: {self.right.row_count} rows, {self.right.duration:.2f}s"
         )
 
-    def _check_column_match(self, left_df: pd.DataFrame, right_df: pd.DataFrame) -> bool:
+    def _check_column_match(self) -> bool:
         """Check if column names match between dataframes (case-insensitive)"""
-        left_cols_lower = {col.lower() for col in left_df.columns}
-        right_cols_lower = {col.lower() for col in right_df.columns}
-        return left_cols_lower == right_cols_lower
+        return self._left_columns.keys() == self._right_columns.keys()
 
-    def _compare_columns(
-        self, left_df: pd.DataFrame, right_df: pd.DataFrame
-    ) -> Dict[str, List[str]]:
+    def _compare_columns(self) -> Dict[str, List[str]]:
         """Compare columns between dataframes and categorize them"""
-        left_cols_lower = {col.lower(): col for col in left_df.columns}
-        right_cols_lower = {col.lower(): col for col in right_df.columns}
-
-        left_only_lower = set(left_cols_lower.keys()) - set(right_cols_lower.keys())
-        right_only_lower = set(right_cols_lower.keys()) - set(left_cols_lower.keys())
-        matching_lower = set(left_cols_lower.keys()) & set(right_cols_lower.keys())
+        left_keys = self._left_columns.keys()
+        right_keys = self._right_columns.keys()
 
         # Return original case column names
         return {
-            "left_only": sorted([left_cols_lower[col] for col in left_only_lower]),
-            "right_only": sorted([right_cols_lower[col] for col in right_only_lower]),
-            "matching": sorted([left_cols_lower[col] for col in matching_lower]),
+            "left_only": sorted(self._left_columns[col] for col in left_keys - right_keys),
+            "right_only": sorted(self._right_columns[col] for col in right_keys - left_keys),
+            "matching": sorted(self._left_columns[col] for col in left_keys & right_keys),
         }
 
-    def _normalize_column_names(
-        self, left_df: pd.DataFrame, right_df: pd.DataFrame
-    ) -> pd.DataFrame:
-        """Create a copy of right_df with column names matching left_df's case"""
-        col_mapping = {}
-        for left_col in left_df.columns:
-            for right_col in right_df.columns:
-                if left_col.lower() == right_col.lower():
-                    col_mapping[right_col] = left_col
-                    break
-
-        # Return a copy with renamed columns to match left case
+    def _normalize_column_names(self, right_df: pd.DataFrame) -> pd.DataFrame:
+        """Return right_df with column names matching the left result's case"""
+        col_mapping = {
+            right_col: self._left_columns[lower]
+            for lower, right_col in self._right_columns.items()
+            if lower in self._left_columns and self._left_columns[lower] != right_col
+        }
+
+        # Only rename when a name actually differs; the frame is never modified in place
         if col_mapping:
             return right_df.rename(columns=col_mapping)
-        return right_df.copy()
+        return right_df
 
     def _normalize_data_types(
         self, left_df: pd.DataFrame, right_df: pd.DataFrame
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
         """Normalize data types between dataframes for consistent comparison"""
-        left_normalized = left_df.copy()
-        right_normalized = right_df.copy()
-
+        # Classify columns in one pass over the dtypes. Columns numeric on both sides are left
+        # alone, since pd.to_numeric returns numeric columns unchanged
+        left_dtypes = left_df.dtypes
+        right_dtypes = right_df.dtypes
+        str_cols: List[str] = []
+        datetime_cols: List[str] = []
+        types = pd.api.types
         for col in left_df.columns:
-            # String type normalization
-            if left_df[col].dtype == object or right_df[col].dtype == object:
-                left_normalized[col] = left_normalized[col].astype(str).str.strip()
-                right_normalized[col] = right_normalized[col].astype(str).str.strip()
-
-            # Numeric type normalization
-            elif pd.api.types.is_numeric_dtype(left_df[col]) and pd.api.types.is_numeric_dtype(
-                right_df[col]
+            left_dtype, right_dtype = left_dtypes[col], right_dtypes[col]
+            # is_string_dtype covers object, "str" and Arrow string columns from connectorx alike
+            if types.is_string_dtype(left_dtype) or types.is_string_dtype(right_dtype):
+                str_cols.append(col)
+            elif types.is_numeric_dtype(left_dtype) and types.is_numeric_dtype(right_dtype):
+                continue
+            elif types.is_datetime64_any_dtype(left_dtype) or types.is_datetime64_any_dtype(
+                right_dtype
             ):
-                left_normalized[col] = pd.to_numeric(left_normalized[col], errors="coerce")
-                right_normalized[col] = pd.to_numeric(right_normalized[col], errors="coerce")
+                datetime_cols.append(col)
+
+        if not str_cols and not datetime_cols:
+            return left_df, right_df
 
-            # Date type normalization
-            elif pd.api.types.is_datetime64_dtype(left_df[col]) or pd.api.types.is_datetime64_dtype(
+        # Normalized columns are assigned as new arrays, so shallow copies leave the inputs
+        # untouched without duplicating every column up front
+        left_normalized = left_df.copy(deep=False)
+        right_normalized = right_df.copy(deep=False)
+
+        for col in datetime_cols:
+            try:
+                left_normalized[col] = pd.to_datetime(left_normalized[col], errors="coerce")
+                right_normalized[col] = pd.to_datetime(right_normalized[col], errors="coerce")
+            except Exception:
+                # Fallback to string comparison if datetime conversion fails
+                str_cols.append(col)
+
+        for col in str_cols:
+            left_normalized[col] = left_normalized[col].astype(str).str.strip()
+            right_normalized[col] = right_normalized[col].astype(str).str.strip()
+
+        return left_normalized, right_normalized
+
+    def _fast_symmetric_diff(
+        self, left_df: pd.DataFrame, right_df: pd.DataFrame
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """Return masks of the rows only in left and only in right, matched by row hash"""
+        left_df = left_df.copy(deep=False)
+        right_df = right_df.copy(deep=False)
+
+        # Equal values hash equally only under the same dtype, so align mismatched columns
+        for col in left_df.columns:
+            if left_df[col].dtype == right_df[col].dtype:
+                continue
+            if pd.api.types.is_numeric_dtype(left_df[col]) and pd.api.types.is_numeric_dtype(
                 right_df[col]
             ):
-                try:
-                    left_normalized[col] = pd.to_datetime(left_normalized[col], errors="coerce")
-                    right_normalized[col] = pd.to_datetime(right_normalized[col], errors="coerce")
-                except Exception:
-                    # Fallback to string comparison if datetime conversion fails
-                    left_normalized[col] = left_normalized[col].astype(str).str.strip()
-                    right_normalized[col] = right_normalized[col].astype(str).str.strip()
+                left_df[col] = left_df[col].astype("float64")
+                right_df[col] = right_df[col].astype("float64")
+            else:
+                left_df[col] = left_df[col].astype(str)
+                right_df[col] = right_df[col].astype(str)
 
-        return left_normalized, right_normalized
+        # Categorical columns hash each distinct string once and map the codes, giving the
+        # same hashes as the plain column at a fraction of the cost for repetitive text
+        for col in left_df.columns:
+            if pd.api.types.is_string_dtype(left_df[col].dtype):
+                left_df[col] = left_df[col].astype("category")
+            if pd.api.types.is_string_dtype(right_df[col].dtype):
+                right_df[col] = right_df[col].astype("category")
+
+        left_hashes = pd.util.hash_pandas_object(left_df, index=False)
+        right_hashes = pd.util.hash_pandas_object(right_df, index=False)
+
+        # Identical results usually come back in the same order, which one linear pass confirms
+        if np.array_equal(left_hashes.to_numpy(), right_hashes.to_numpy()):
+            no_rows = np.zeros(len(left_hashes), dtype=np.bool_)
+            return no_rows, no_rows.copy()
+
+        # With skewed sizes, build one hash table on the smaller side and probe it with both
+        if 2 * min(len(left_hashes), len(right_hashes)) <= max(len(left_hashes), len(right_hashes)):
+            return self._skewed_hash_diff(left_hashes, right_hashes)
+
+        # Series.isin probes a hash table, where np.isin sorts both arrays (~9x slower here)
+        left_only_mask = ~left_hashes.isin(right_hashes).to_numpy()
+        right_only_mask = ~right_hashes.isin(left_hashes).to_numpy()
+        return left_only_mask, right_only_mask
+
+    def _skewed_hash_diff(
+        self, left_hashes: "pd.Series[int]", right_hashes: "pd.Series[int]"
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """Return the left-only and right-only masks, hashing only the smaller side"""
+        swapped = len(left_hashes) > len(right_hashes)
+        small, large = (right_hashes, left_hashes) if swapped else (left_hashes, right_hashes)
+
+        # Probe the small side's distinct hashes with the large side, and record which of
+        # them were hit to answer the reverse lookup without a table over the large side
+        codes, uniques = pd.factorize(small)
+        positions = uniques.get_indexer(pd.Index(large))
+        large_in_small = positions >= 0
+        hit = np.zeros(len(uniques), dtype=np.bool_)
+        hit[positions[large_in_small]] = True
+        small_in_large = hit[codes]
+
+        if swapped:
+            return ~large_in_small, ~small_in_large
+        return ~small_in_large, ~large_in_small
+
+    def _row_string_keys(self, df: pd.DataFrame) -> "pd.Series[str]":
+        """Join each row's values as strings, building the keys column by column"""
+        # map(str) formats every value on its own, so both sides agree regardless of how
+        # pandas would format the column as a whole; concatenating whole columns avoids
+        # building a Series per row (~19x faster than a row-wise apply)
+        keys = df.iloc[:, 0].map(str)
+        for col in df.columns[1:]:
+            keys = keys + "|" + df[col].map(str)
+        return keys
+
+    def _with_column_order(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Return df with its columns in the given order, without a reindex if already so"""
+        if list(df.columns) == columns:
+            return df
+        return df[columns]
 
     def _compare_dataframes(self, left_df: pd.DataFrame, right_df: pd.DataFrame) -> None:
         """Compare two dataframes and identify matching/non-matching rows"""
         # Normalize column names to match case
-        right_df_normalized = self._normalize_column_names(left_df, right_df)
+        right_df_normalized = self._normalize_column_names(right_df)
+
+        # With one side empty no row can match, so skip normalization and hashing;
+        # is_equal stays False since there are no common rows
+        columns = sorted(left_df.columns)
+        if left_df.empty or right_df_normalized.empty:
+            self._left_only = self._with_column_order(left_df, columns)
+            self._right_only = self._with_column_order(right_df_normalized, columns)
+            self._common_source = self._left_only.iloc[0:0]
+            return
 
         # Normalize data types for proper comparison
         left_normalized, right_normalized = self._normalize_data_types(left_df, right_df_normalized)
 
         # Sort columns for consistent comparison
-        left_sorted = left_normalized[sorted(left_normalized.columns)]
-        right_sorted = right_normalized[sorted(right_normalized.columns)]
+        left_sorted = self._with_column_order(left_normalized, columns)
+        right_sorted = self._with_column_order(right_normalized, columns)
 
         try:
-            # Perform the merge to identify differences
-            merged = left_sorted.merge(right_sorted, how="outer", indicator=True)
+            # Match rows by a vectorized 64-bit hash instead of an outer merge on every column
+            left_only_mask, right_only_mask = self._fast_symmetric_diff(left_sorted, right_sorted)
 
             # Extract the results
-            self.left_only = merged[merged["_merge"] == "left_only"].drop("_merge", axis=1)
-            self.right_only = merged[merged["_merge"] == "right_only"].drop("_merge", axis=1)
-            self.common_rows = merged[merged["_merge"] == "both"].drop("_merge", axis=1)
+            self._left_only = left_sorted[left_only_mask]
+            self._right_only = right_sorted[right_only_mask]
+            self._common_source = left_sorted
+            self._common_mask = ~left_only_mask
+            self._common_count = len(left_sorted) - int(np.count_nonzero(left_only_mask))
 
         except Exception as e:
-            console.print(f"[dim]Merge operation failed: {e}[/]")
+            console.print(f"[dim]Row hash comparison failed: {e}[/]")
             console.print("[dim]Falling back to alternative comparison method...[/]")
 
-            # Alternative approach: use set-like operations with string representations
-            # Convert rows to hashable strings for set operations
-            left_strings = set(left_sorted.apply(lambda x: "|".join(x.astype(str)), axis=1))
-            right_strings = set(right_sorted.apply(lambda x: "|".join(x.astype(str)), axis=1))
-
-            # Find differences using set operations
-            left_only_strings = left_strings - right_strings
-            right_only_strings = right_strings - left_strings
-            common_strings = left_strings & right_strings
+            # Alternative approach: match rows by their string representations,
+            # built once per side and probed with a single hash-table lookup each way
+            left_keys = self._row_string_keys(left_sorted)
+            right_keys = self._row_string_keys(right_sorted)
+            left_in_right = left_keys.isin(right_keys)
+            right_in_left = right_keys.isin(left_keys)
 
-            # Convert back to DataFrames by filtering original data
-            if left_only_strings:
-                left_mask = left_sorted.apply(lambda x: "|".join(x.astype(str)), axis=1).isin(
-                    left_only_strings
-                )
-                self.left_only = left_sorted[left_mask].drop_duplicates()
-            else:
-                self.left_only = pd.DataFrame(columns=left_sorted.columns)
-
-            if right_only_strings:
-                right_mask = right_sorted.apply(lambda x: "|".join(x.astype(str)), axis=1).isin(
-                    right_only_strings
-                )
-                self.right_only = right_sorted[right_mask].drop_duplicates()
-            else:
-                self.right_only = pd.DataFrame(columns=right_sorted.columns)
-
-            if common_strings:
-                common_mask = left_sorted.apply(lambda x: "|".join(x.astype(str)), axis=1).isin(
-                    common_strings
-                )
-                self.common_rows = left_sorted[common_mask].drop_duplicates()
-            else:
-                self.common_rows = pd.DataFrame(columns=left_sorted.columns)
+            self._left_only = left_sorted[~left_in_right].drop_duplicates()
+            self._right_only = right_sorted[~right_in_left].drop_duplicates()
+            self._common_source = left_sorted[left_in_right].drop_duplicates()
+            self._common_count = len(self._common_source)
 
         # Sets is_equal if we have no differences (both sets match entirely)
-        left_only_count = len(self.left_only)
-        right_only_count = len(self.right_only)
-        both_count = len(self.common_rows)
+        left_only_count = len(self._left_only)
+        right_only_count = len(self._right_only)
+        both_count = self._common_count
 
-        self.is_equal = left_only_count == 0 and right_only_count == 0 and both_count > 0
+        self._is_equal = left_only_count == 0 and right_only_count == 0 and both_count > 0
 
     def calculate_performance_metrics(self) -> dict[str, str]:
         """Calculate performance metrics between left and right queries."""
@@ -265,7 +429,7 @@ class ComparisonResult:
 
         if not self.is_equal:
             if not self.columns_match:
-                column_comparison = self._compare_columns(self.left.results, self.right.results)
+                column_comparison = self._compare_columns()
 
                 console.print("[bold red]Column mismatch:[/]")
 
@@ -324,7 +488,7 @@ class ComparisonResult:
                     right_only_pct = "N/A"
 
                 # Common rows
-                common_count = len(self.common_rows)
+                common_count = self.common_count
                 if self.left.row_count > 0:
                     common_pct = f"{common_count / self.left.row_count * 100:.1f}% of left"
                 else:
@@ -337,25 +501,73 @@ class ComparisonResult:
                 console.print(diff_table)
 
                 max_samples = 5
-                if not self.left_only.empty:
-                    left_sample_count = min(max_samples, len(self.left_only))
+                if left_only_count:
+                    left_sample_count = min(max_samples, left_only_count)
                     console.print(
                         f"\n[bold]Sample rows in left but not in right "
-                        f"({left_sample_count} of {len(self.left_only)}):[/]"
+                        f"({left_sample_count} of {left_only_count}):[/]"
                     )
-                    console.print(Pretty(self.left_only.head(max_samples)))
+                    console.print(Pretty(self.left_only.iloc[:max_samples]))
 
-                if not self.right_only.empty:
-                    right_sample_count = min(max_samples, len(self.right_only))
+                if right_only_count:
+                    right_sample_count = min(max_samples, right_only_count)
                     console.print(
                         f"\n[bold]Sample rows in right but not in left "
-                        f"({right_sample_count} of {len(self.right_only)}):[/]"
+                        f"({right_sample_count} of {right_only_count}):[/]"
                     )
-                    console.print(Pretty(self.right_only.head(max_samples)))
+                    console.print(Pretty(self.right_only.iloc[:max_samples]))
 
         console.print()
 
 
+@dataclass
+class QueryCache:
+    """Parquet cache of query results, keyed by connection, query text and parameters"""
+
+    directory: Path
+    max_rows: int = 1_000_000
+
+    def path_for(
+        self,
+        conn: Connection,
+        sql_query: str,
+        params: Optional[Tuple[Any, ...]],
+        fetch_backend: str,
+    ) -> Path:
+        """Return the cache file for a query; the backend is part of the key as dtypes differ"""
+        fingerprint = "\0".join(
+            (str(conn.db_type), conn.connection_string, fetch_backend, repr(params), sql_query)
+        )
+        return self.directory / f"{hashlib.sha256(fingerprint.encode()).hexdigest()}.parquet"
+
+    def load(self, path: Path) -> Optional[pd.DataFrame]:
+        """Return the cached results at path, or None on a cache miss"""
+        if not path.exists():
+            return None
+        return pd.read_parquet(path, engine="pyarrow")
+
+    def store(self, path: Path, df: pd.DataFrame) -> None:
+        """
+        Cache results at path, skipping frames over max_rows or without a Parquet type.
+        A failed write only skips the cache; it never fails the comparison.
+        """
+        if len(df) > self.max_rows:
+            return
+
+        # Both sides of a comparison may run the same query, so write to a private file
+        # and rename it into place, which readers never see half-written
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, engine="pyarrow", index=False)
+            os.replace(tmp_path, path)
+        except (TypeError, ValueError, OSError, pa.ArrowException) as e:
+            # Object columns Arrow can't type (mixed values, UUIDs, sql_variant) raise
+            # ArrowException subclasses rather than TypeError/ValueError
+            tmp_path.unlink(missing_ok=True)
+            console.print(f"[dim]Query results not cached: {e}[/]")
+
+
 @dataclass
 class ComparisonItem:
     """Type definition for a single comparison configuration"""
@@ -369,6 +581,9 @@ class ComparisonItem:
     schema_name: str = ""
     left_db_type: str = "mssql"
     right_db_type: str = "mssql"
+    # Numeric column connectorx splits each query's fetch on, and how many slices to fetch
+    partition_on: Optional[str] = None
+    partition_num: int = 4
 
     @property
     def full_table_name(self) -> str:
@@ -436,6 +651,8 @@ class ComparisonConfig:
                 right_db_type=item.get("right_db_type", "mssql"),
                 table_name=item.get("table_name", "table_name_not_provided"),
                 schema_name=item.get("schema_name", ""),
+                partition_on=item.get("partition_on"),
+                partition_num=item.get("partition_num", 4),
             )
             comparisons.append(comparison)
 
@@ -448,8 +665,7 @@ class ComparisonConfig:
         if not sql_path.exists():
             raise FileNotFoundError(f"SQL file not found: {sql_path}")
 
-        with open(sql_path) as f:
-            return f.read()
+        return read_sql_file(str(sql_path))
 
     def rich_display(self) -> None:
         """Display the configuration using Rich formatting"""
@@ -1,40 +1,286 @@
 import os
 import re
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 
-from data_compare.data_compare_types import ComparisonConfig, ComparisonResult, QueryResult
+from data_compare.data_compare_types import (
+    ComparisonConfig,
+    ComparisonItem,
+    ComparisonResult,
+    QueryCache,
+    QueryResult,
+)
 from utils import Connection
 from utils.rich_utils import COLORS, console
 
+FETCH_BACKENDS = ("sqlalchemy", "connectorx")
+
+# Used to turn comparison names into output file names
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-z0-9_-]")
+
+# Output files pandas writes go through a 1 MiB buffer, so large files take far fewer writes
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+QueryFuture = Future[Tuple[pd.DataFrame, float]]
+ComparisonFuture = Future[ComparisonResult]
+
+
+def _read_sql_connectorx(
+    conn: Connection, sql_query: str, partition_on: Optional[str], partition_num: int
+) -> Optional[pd.DataFrame]:
+    """
+    Read a query through ConnectorX's Arrow transport, or None if it is not installed.
+    With partition_on, ConnectorX splits the query on that numeric column's range and fetches
+    partition_num slices over separate connections at once.
+    """
+    try:
+        import connectorx as cx
+    except ImportError:
+        return None
+
+    partition_args: Dict[str, Any] = {}
+    if partition_on and partition_num > 1:
+        partition_args = {"partition_on": partition_on, "partition_num": partition_num}
+    table = cx.read_sql(conn.uri, sql_query, return_type="arrow", **partition_args)
+    # ArrowDtype columns wrap the Arrow buffers as they are, so no value becomes a Python object
+    # and integer columns with NULLs stay integers instead of widening to float
+    df: pd.DataFrame = table.to_pandas(types_mapper=pd.ArrowDtype)
+    return df
+
+
+def _fetch_sql_query(
+    conn: Connection,
+    sql_query: str,
+    params: Optional[Tuple[Any, ...]],
+    fetch_backend: str,
+    partition_on: Optional[str] = None,
+    partition_num: int = 1,
+) -> pd.DataFrame:
+    """Read a query's results through the configured fetch backend"""
+    # ConnectorX has no parameter binding, so parameterized queries keep the SQLAlchemy path
+    if fetch_backend == "connectorx" and params is None:
+        try:
+            df = _read_sql_connectorx(conn, sql_query, partition_on, partition_num)
+        except Exception as e:
+            # Drivers or column types ConnectorX doesn't support still work through SQLAlchemy
+            console.print(f"[yellow]connectorx failed ({e}), using SQLAlchemy[/]")
+        else:
+            if df is not None:
+                return df
+            console.print("[yellow]connectorx is not installed, using SQLAlchemy[/]")
+
+    engine = conn.get_sqlalchemy_engine()
+    return pd.read_sql_query(sql_query, engine, params=params)
+
 
 def execute_sql_query(
-    conn: Connection, sql_query: str, params: Optional[Tuple[Any, ...]] = None
+    conn: Connection,
+    sql_query: str,
+    params: Optional[Tuple[Any, ...]] = None,
+    fetch_backend: str = "sqlalchemy",
+    show_status: bool = True,
+    query_cache: Optional[QueryCache] = None,
+    partition_on: Optional[str] = None,
+    partition_num: int = 1,
 ) -> Tuple[pd.DataFrame, float]:
-    """Execute a SQL query and return results with execution duration"""
-    start_time = datetime.now()
+    """
+    Execute a SQL query and return results with execution duration.
+    Pass show_status=False when running on a worker thread, so status lines don't interleave.
+    With a query_cache, results cached by an earlier run are loaded instead of re-running the
+    query, and the duration is the load time. partition_on and partition_num split the fetch
+    across connections when using the connectorx backend.
+    """
+    start_time = time.perf_counter_ns()
+
+    cache_path = None
+    if query_cache is not None:
+        cache_path = query_cache.path_for(conn, sql_query, params, fetch_backend)
+        cached = query_cache.load(cache_path)
+        if cached is not None:
+            duration = (time.perf_counter_ns() - start_time) / 1e9
+            console.print(f"[dim]Loaded cached query results from {cache_path}[/]")
+            return cached, duration
 
     query_preview = sql_query[:50].replace("\n", " ") + ("..." if len(sql_query) > 50 else "")
-    console.print(f"[dim]Executing query:[/] [blue]{query_preview}[/]", end="\r")
+    if show_status:
+        console.print(f"[dim]Executing query:[/] [blue]{query_preview}[/]", end="\r")
 
     try:
-        engine = conn.get_sqlalchemy_engine()
-        df = pd.read_sql_query(sql_query, engine, params=params)
+        df = _fetch_sql_query(conn, sql_query, params, fetch_backend, partition_on, partition_num)
 
-        duration = (datetime.now() - start_time).total_seconds()
-        console.print(f"[green]Query completed in {duration:.2f}s[/]       ")
+        if query_cache is not None and cache_path is not None:
+            query_cache.store(cache_path, df)
+
+        duration = (time.perf_counter_ns() - start_time) / 1e9
+        if show_status:
+            console.print(f"[green]Query completed in {duration:.2f}s[/]       ")
         return df, duration
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        console.print(f"[red]Query failed after {duration:.2f}s[/]       ")
+        duration = (time.perf_counter_ns() - start_time) / 1e9
+        if show_status:
+            console.print(f"[red]Query failed after {duration:.2f}s[/]       ")
+        raise Exception(f"Query failed after {duration:.2f}s: {str(e)}") from e
+
+
+# Hash given to NULL in every column, whatever dtype the chunk it arrived in had
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+# Odd multiplier folding each column's hash into the row hash (wraps modulo 2**64)
+_ROW_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def _canonical_kind(values: "pd.Series[Any]") -> str:
+    """Classify a column as int, float, datetime or text for canonical hashing"""
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+        return "int"
+    if pd.api.types.is_float_dtype(values):
+        return "float"
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return "datetime"
+    return "text"
+
+
+def _hash_present_values(present: "pd.Series[Any]", kind: str) -> npt.NDArray[np.uint64]:
+    """Hash a column's non-NULL values in their canonical form"""
+    hashes: npt.NDArray[np.uint64]
+    if kind == "int":
+        # Integers hash exactly, so BIGINT keys past 2**53 stay distinct
+        hashes = pd.util.hash_array(present.to_numpy(dtype=np.int64))
+    elif kind == "float":
+        # Whole floats hash like the equal integer, so INT on one side matches FLOAT on the other
+        floats = present.to_numpy(dtype=np.float64)
+        whole = np.isfinite(floats) & (np.floor(floats) == floats) & (np.abs(floats) < 2.0**63)
+        hashes = np.empty(len(floats), dtype=np.uint64)
+        hashes[whole] = pd.util.hash_array(floats[whole].astype(np.int64))
+        hashes[~whole] = pd.util.hash_array(floats[~whole])
+    elif kind == "datetime":
+        timestamps = pd.to_datetime(present, utc=True).dt.tz_localize(None)
+        hashes = pd.util.hash_array(timestamps.astype("datetime64[ns]").to_numpy().view(np.int64))
+    else:
+        hashes = pd.util.hash_array(present.astype(str).str.strip().to_numpy(dtype=object))
+    return hashes
+
+
+def _canonical_row_hashes(chunk: pd.DataFrame, kinds: Dict[str, str]) -> "pd.Series[int]":
+    """
+    Hash each row in a form that doesn't depend on which side or chunk it came from.
+    kinds maps lower-cased column names to their canonical kind; a column's kind is fixed by
+    the first chunk holding a non-NULL value in it, and NULLs hash alike under every kind.
+    """
+    # Column case and order vary between sides, so fold columns in lower-cased sorted order
+    columns = {col.lower(): col for col in chunk.columns}
+    row_hashes = np.zeros(len(chunk), dtype=np.uint64)
+    for lower in sorted(columns):
+        values = chunk[columns[lower]]
+        nulls = values.isna().to_numpy()
+        column_hashes = np.full(len(chunk), _NULL_HASH, dtype=np.uint64)
+        if not nulls.all():
+            kind = kinds.setdefault(lower, _canonical_kind(values))
+            column_hashes[~nulls] = _hash_present_values(values[~nulls], kind)
+        row_hashes = row_hashes * _ROW_HASH_MULTIPLIER + column_hashes
+    return pd.Series(row_hashes, index=chunk.index, dtype=np.uint64)
+
+
+def stream_sql_query(
+    conn: Connection,
+    sql_query: str,
+    chunk_size: int,
+    exclude_hashes: Optional[npt.NDArray[np.uint64]] = None,
+) -> Tuple[QueryResult, npt.NDArray[np.uint64], pd.DataFrame]:
+    """
+    Stream a query in chunks, keeping only a 64-bit hash per row.
+    Returns the query result (column schema and row count), the row hashes, and the rows whose
+    hash is not in exclude_hashes (no rows when exclude_hashes is None).
+    """
+    start_time = time.perf_counter_ns()
+    hashes: List[npt.NDArray[np.uint64]] = []
+    kept: List[pd.DataFrame] = []
+    schema = pd.DataFrame()
+    row_count = 0
+    kinds: Dict[str, str] = {}
+
+    try:
+        engine = conn.get_sqlalchemy_engine()
+        # stream_results uses a server-side cursor, so drivers don't buffer the whole result
+        with engine.connect().execution_options(stream_results=True) as sa_conn:
+            # Nullable dtypes keep integer columns integral in chunks that hold NULLs
+            for chunk in pd.read_sql_query(
+                sql_query, sa_conn, chunksize=chunk_size, dtype_backend="numpy_nullable"
+            ):
+                chunk = chunk[sorted(chunk.columns)]
+                if not hashes:
+                    schema = chunk.iloc[0:0]
+                chunk_hashes = _canonical_row_hashes(chunk, kinds)
+                hashes.append(np.asarray(chunk_hashes, dtype=np.uint64))
+                row_count += len(chunk)
+                if exclude_hashes is not None:
+                    kept.append(chunk[~chunk_hashes.isin(exclude_hashes).to_numpy()])
+    except Exception as e:
+        duration = (time.perf_counter_ns() - start_time) / 1e9
         raise Exception(f"Query failed after {duration:.2f}s: {str(e)}") from e
 
+    duration = (time.perf_counter_ns() - start_time) / 1e9
+    result = QueryResult(results=schema, duration=duration, streamed_rows=row_count)
+    all_hashes = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+    kept_rows = pd.concat(kept, ignore_index=True) if kept else schema
+    return result, all_hashes, kept_rows
+
+
+def compare_sql_streaming(
+    left_conn: Connection,
+    right_conn: Connection,
+    left_query: str,
+    right_query: str,
+    chunk_size: int,
+) -> ComparisonResult:
+    """
+    Compare two SQL queries chunk by chunk, holding row hashes instead of full result sets.
+    Common rows are counted but not kept; the left query runs a second time only when it has
+    rows missing from the right, to collect them.
+    """
+    with _create_query_progress() as progress:
+        task_left = progress.add_task("Streaming left query...", total=1)
+        left_result, left_hashes, _ = stream_sql_query(left_conn, left_query, chunk_size)
+        progress.update(task_left, completed=1)
+
+        task_right = progress.add_task("Streaming right query...", total=1)
+        right_result, right_hashes, right_only = stream_sql_query(
+            right_conn, right_query, chunk_size, exclude_hashes=left_hashes
+        )
+        progress.update(task_right, completed=1)
+
+        left_in_right = pd.Series(left_hashes).isin(right_hashes).to_numpy()
+        left_only = left_result.results
+        if not left_in_right.all():
+            task_rerun = progress.add_task("Collecting left-only rows...", total=1)
+            _, _, left_only = stream_sql_query(
+                left_conn, left_query, chunk_size, exclude_hashes=right_hashes
+            )
+            progress.update(task_rerun, completed=1)
+
+    comparison = ComparisonResult.from_streamed(
+        left_result,
+        right_result,
+        left_only=left_only,
+        right_only=right_only,
+        common_count=int(left_in_right.sum()),
+    )
+    comparison.rich_display()
+
+    return comparison
+
 
 def compare_sql(
     left_conn: Connection,
@@ -44,32 +290,142 @@ def compare_sql(
     *,
     left_params: Optional[Tuple[Any, ...]] = None,
     right_params: Optional[Tuple[Any, ...]] = None,
+    fetch_backend: str = "sqlalchemy",
+    query_cache: Optional[QueryCache] = None,
+    partition_on: Optional[str] = None,
+    partition_num: int = 1,
 ) -> ComparisonResult:
-    """Compare the results of two SQL queries"""
-    with Progress(
+    """Compare the results of two SQL queries, running both at the same time"""
+    # The queries wait on independent connections, so neither has to wait for the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        left_future = executor.submit(
+            execute_sql_query,
+            left_conn,
+            left_query,
+            left_params,
+            fetch_backend,
+            False,
+            query_cache,
+            partition_on,
+            partition_num,
+        )
+        right_future = executor.submit(
+            execute_sql_query,
+            right_conn,
+            right_query,
+            right_params,
+            fetch_backend,
+            False,
+            query_cache,
+            partition_on,
+            partition_num,
+        )
+        return compare_query_futures(left_future, right_future)
+
+
+def _create_query_progress() -> Progress:
+    """Create the progress display shown while a comparison's queries run"""
+    return Progress(
         TextColumn("[bold blue]{task.description}"),
         BarColumn(complete_style="green"),
         TimeElapsedColumn(),
         console=console,
         expand=False,
-    ) as progress:
-        # Left Query Execution
-        task_left = progress.add_task("Executing left query...", total=1)
-        left_results, left_duration = execute_sql_query(
-            conn=left_conn, sql_query=left_query, params=left_params
-        )
-        left_result = QueryResult(results=left_results, duration=left_duration)
-        progress.update(task_left, completed=1)
+    )
+
+
+def submit_comparison_queries(
+    executor: ThreadPoolExecutor,
+    comparison: ComparisonItem,
+    fetch_backend: str,
+    query_cache: Optional[QueryCache] = None,
+) -> Tuple[QueryFuture, QueryFuture]:
+    """Start a comparison's left and right queries on the executor"""
+    return (
+        executor.submit(
+            execute_sql_query,
+            comparison.left_connection,
+            comparison.left_query,
+            None,
+            fetch_backend,
+            False,
+            query_cache,
+            comparison.partition_on,
+            comparison.partition_num,
+        ),
+        executor.submit(
+            execute_sql_query,
+            comparison.right_connection,
+            comparison.right_query,
+            None,
+            fetch_backend,
+            False,
+            query_cache,
+            comparison.partition_on,
+            comparison.partition_num,
+        ),
+    )
+
+
+def compare_query_futures(left_future: QueryFuture, right_future: QueryFuture) -> ComparisonResult:
+    """Compare the results of two queries already started by submit_comparison_queries"""
+    with _create_query_progress() as progress:
+        # Both queries run at once, so each task completes when its own query does
+        task_left = progress.add_task("Waiting for left query...", total=1)
+        task_right = progress.add_task("Waiting for right query...", total=1)
+        left_future.add_done_callback(lambda _: progress.update(task_left, completed=1))
+        right_future.add_done_callback(lambda _: progress.update(task_right, completed=1))
+
+        left_results, left_duration = left_future.result()
+        right_results, right_duration = right_future.result()
+
+    comparison = ComparisonResult(
+        QueryResult(results=left_results, duration=left_duration),
+        QueryResult(results=right_results, duration=right_duration),
+    )
+    comparison.rich_display()
+
+    return comparison
 
-        # Right Query Execution
-        task_right = progress.add_task("Executing right query...", total=1)
-        right_results, right_duration = execute_sql_query(
-            conn=right_conn, sql_query=right_query, params=right_params
-        )
-        right_result = QueryResult(results=right_results, duration=right_duration)
-        progress.update(task_right, completed=1)
 
-    comparison = ComparisonResult(left_result, right_result)
+def _build_comparison_result(
+    left_future: QueryFuture, right_future: QueryFuture
+) -> ComparisonResult:
+    """Wait for both queries and diff their results, without displaying anything"""
+    left_results, left_duration = left_future.result()
+    right_results, right_duration = right_future.result()
+    result = ComparisonResult(
+        QueryResult(results=left_results, duration=left_duration),
+        QueryResult(results=right_results, duration=right_duration),
+    )
+    # The diff is lazy, so run it here on the worker rather than when it is displayed
+    result.compute_diff()
+    return result
+
+
+def submit_comparison(
+    query_executor: ThreadPoolExecutor,
+    compare_executor: ThreadPoolExecutor,
+    comparison: ComparisonItem,
+    fetch_backend: str,
+    query_cache: Optional[QueryCache] = None,
+) -> ComparisonFuture:
+    """Start a comparison's queries, and its diff once they finish, in the background"""
+    # Diffs wait on query futures, so they run on their own executor; sharing one could
+    # leave every worker blocked on queries queued behind them
+    left_future, right_future = submit_comparison_queries(
+        query_executor, comparison, fetch_backend, query_cache
+    )
+    return compare_executor.submit(_build_comparison_result, left_future, right_future)
+
+
+def await_comparison(comparison_future: ComparisonFuture) -> ComparisonResult:
+    """Wait for a comparison started by submit_comparison and display its result"""
+    with _create_query_progress() as progress:
+        task = progress.add_task("Waiting for queries and comparison...", total=1)
+        comparison = comparison_future.result()
+        progress.update(task, completed=1)
+
     comparison.rich_display()
 
     return comparison
@@ -130,6 +486,87 @@ def handle_output_files(
             )
 
 
+def _read_fetch_settings(config: ComparisonConfig) -> Tuple[str, int, int]:
+    """Read and validate fetch_backend, chunk_size and parallelism from config"""
+    fetch_backend = config.config.get("fetch_backend", "sqlalchemy")
+    if fetch_backend not in FETCH_BACKENDS:
+        raise ValueError(
+            f"Invalid fetch_backend '{fetch_backend}'. Must be one of: {', '.join(FETCH_BACKENDS)}"
+        )
+
+    chunk_size = config.config.get("chunk_size", 0)
+    if not isinstance(chunk_size, int) or chunk_size < 0:
+        raise ValueError(f"chunk_size must be a non-negative integer, got {chunk_size!r}")
+
+    parallelism = config.config.get("parallelism", 4)
+    if not isinstance(parallelism, int) or parallelism < 1:
+        raise ValueError(f"parallelism must be a positive integer, got {parallelism!r}")
+
+    return fetch_backend, chunk_size, parallelism
+
+
+def _read_query_cache(config: ComparisonConfig) -> Optional[QueryCache]:
+    """Return the query cache configured by query_cache_dir, or None when it is unset"""
+    cache_dir = config.config.get("query_cache_dir", "")
+    if not cache_dir:
+        return None
+
+    max_rows = config.config.get("query_cache_max_rows", 1_000_000)
+    if not isinstance(max_rows, int) or max_rows < 0:
+        raise ValueError(f"query_cache_max_rows must be a non-negative integer, got {max_rows!r}")
+
+    return QueryCache(directory=Path(cache_dir), max_rows=max_rows)
+
+
+def _compare_item(
+    config: ComparisonConfig,
+    comparison: ComparisonItem,
+    comparison_future: Optional[ComparisonFuture],
+    fetch_backend: str,
+    chunk_size: int,
+    query_cache: Optional[QueryCache],
+) -> bool:
+    """Run or await one comparison, write its output files, and return whether it matched"""
+    if chunk_size:
+        result = compare_sql_streaming(
+            left_conn=comparison.left_connection,
+            right_conn=comparison.right_connection,
+            left_query=comparison.left_query,
+            right_query=comparison.right_query,
+            chunk_size=chunk_size,
+        )
+    elif comparison_future is not None:
+        result = await_comparison(comparison_future)
+    else:
+        result = compare_sql(
+            left_conn=comparison.left_connection,
+            right_conn=comparison.right_connection,
+            left_query=comparison.left_query,
+            right_query=comparison.right_query,
+            fetch_backend=fetch_backend,
+            query_cache=query_cache,
+            partition_on=comparison.partition_on,
+            partition_num=comparison.partition_num,
+        )
+
+    # Handle output file generation if configured
+    output_type = config.config.get("output_type", None)
+    output_dir = config.config.get("output_file_path", "./output/")
+    if output_type and output_dir:
+        handle_output_files(
+            result=result,
+            name=comparison.name,
+            output_type=output_type,
+            output_dir=output_dir,
+            output_table_name=comparison.full_table_name,
+            output_format=config.config.get("output_format", "csv"),
+            timestamp_file=config.config.get("timestamp_file", False),
+            max_sql_in_values=config.config.get("max_sql_in_values", 1000),
+        )
+
+    return result.is_equal
+
+
 def run_comparisons(config: ComparisonConfig) -> bool:
     """Run all SQL comparisons from config"""
     success = True
@@ -139,55 +576,58 @@ def run_comparisons(config: ComparisonConfig) -> bool:
     console.print("[italic]Comparing queries across database systems[/]", justify="center")
     console.print()
 
-    # Get output settings
-    output_type = config.config.get("output_type", None)
-    output_dir = config.config.get("output_file_path", "./output/")
-    output_format = config.config.get("output_format", "csv")
-    timestamp_file = config.config.get("timestamp_file", False)
-    max_sql_in_values = config.config.get("max_sql_in_values", 1000)
-
-    for i, comparison in enumerate(config.comparisons):
-        name = comparison.name
-        color = COLORS[i % len(COLORS)]
-        console.print()
-        console.rule(f"[bold {color}]{name}[/]")
-
-        output_table_name = comparison.full_table_name
-
-        left_conn = comparison.left_connection
-        right_conn = comparison.right_connection
+    fetch_backend, chunk_size, parallelism = _read_fetch_settings(config)
+    query_cache = _read_query_cache(config)
+    comparisons = config.comparisons
+
+    # Queries wait on independent databases, so with parallelism the next comparisons start
+    # while earlier ones are displayed and written, and are diffed as soon as their queries
+    # finish. Only `parallelism` comparisons are in flight, so at most that many results are
+    # held in memory; results are still displayed and written in config order.
+    # Streamed comparisons read their results as they are compared, so they aren't prefetched
+    prefetch = parallelism > 1 and not chunk_size
+    pending: Deque[ComparisonFuture] = deque()
+    next_to_submit = 0
+
+    with (
+        ThreadPoolExecutor(max_workers=parallelism) as query_executor,
+        ThreadPoolExecutor(max_workers=parallelism) as compare_executor,
+    ):
+        for i, comparison in enumerate(comparisons):
+            while prefetch and next_to_submit < len(comparisons) and len(pending) < parallelism:
+                pending.append(
+                    submit_comparison(
+                        query_executor,
+                        compare_executor,
+                        comparisons[next_to_submit],
+                        fetch_backend,
+                        query_cache,
+                    )
+                )
+                next_to_submit += 1
+            comparison_future = pending.popleft() if prefetch else None
 
-        try:
-            console.print(f"Left database type:  [{color}]{comparison.left_db_type}[/]")
-            console.print(f"Right database type: [{color}]{comparison.right_db_type}[/]")
+            name = comparison.name
+            color = COLORS[i % len(COLORS)]
             console.print()
+            console.rule(f"[bold {color}]{name}[/]")
 
-            result = compare_sql(
-                left_conn=left_conn,
-                right_conn=right_conn,
-                left_query=comparison.left_query,
-                right_query=comparison.right_query,
-            )
+            try:
+                console.print(f"Left database type:  [{color}]{comparison.left_db_type}[/]")
+                console.print(f"Right database type: [{color}]{comparison.right_db_type}[/]")
+                console.print()
 
-            # Handle output file generation if configured
-            if output_type and output_dir:
-                handle_output_files(
-                    result=result,
-                    name=name,
-                    output_type=output_type,
-                    output_dir=output_dir,
-                    output_table_name=output_table_name,
-                    output_format=output_format,
-                    timestamp_file=timestamp_file,
-                    max_sql_in_values=max_sql_in_values,
-                )
+                if not _compare_item(
+                    config, comparison, comparison_future, fetch_backend, chunk_size, query_cache
+                ):
+                    success = False
 
-            if not result.is_equal:
+            except Exception as e:
                 success = False
+                console.print(f"[bold red]Error in comparison {name}:[/] {e}")
 
-        except Exception as e:
-            success = False
-            console.print(f"[bold red]Error in comparison {name}:[/] {e}")
+            # The future holds the finished result and both DataFrames; release them now
+            comparison_future = None
 
     console.print()
     if success:
@@ -199,19 +639,6 @@ def run_comparisons(config: ComparisonConfig) -> bool:
     return success
 
 
-def load_sql_file(file_path: str) -> str:
-    """Load SQL query from a file"""
-    from pathlib import Path
-
-    sql_path = Path(file_path)
-
-    if not sql_path.exists():
-        raise FileNotFoundError(f"SQL file not found: {sql_path}")
-
-    with open(sql_path) as f:
-        return f.read()
-
-
 def format_value_for_sql_in(value: Any) -> str:
     """Format a single value for use in SQL IN statement"""
     if pd.isna(value) or value is None:
@@ -231,6 +658,26 @@ def format_value_for_sql_in(value: Any) -> str:
         return f"'{escaped_value}'"
 
 
+def format_series_for_sql_in(values: "pd.Series[Any]") -> List[str]:
+    """Format a column of values for a SQL IN statement, dispatching on its dtype once"""
+    dtype = values.dtype
+    if pd.api.types.is_bool_dtype(dtype) and not values.hasnans:
+        bits: List[str] = np.where(values.to_numpy(dtype=bool), "1", "0").tolist()
+        return bits
+    if pd.api.types.is_integer_dtype(dtype) and not values.hasnans:
+        return list(map(str, values.tolist()))
+    if dtype == np.float64:
+        # NaN is the only float unequal to itself, which is cheaper than pd.isna per value;
+        # float64 values format the same as Python floats, narrower or nullable floats don't
+        return ["NULL" if value != value else str(value) for value in values.tolist()]
+    if pd.api.types.is_string_dtype(dtype) and not pd.api.types.is_object_dtype(dtype):
+        # Escape single quotes by doubling them, then quote every non-null value
+        quoted = "'" + values.str.replace("'", "''", regex=False) + "'"
+        return quoted.where(values.notna(), "NULL").tolist()
+    # Datetimes and mixed object columns keep the per-value rules
+    return [format_value_for_sql_in(value) for value in values]
+
+
 def _format_table_name_for_sql(table_name: str) -> str:
     """Format table name with proper schema.table bracketing for SQL"""
     if "." in table_name:
@@ -239,6 +686,25 @@ def _format_table_name_for_sql(table_name: str) -> str:
     return f"[{table_name}]"
 
 
+def _first_unique_rows(
+    dataset: pd.DataFrame, max_values: Optional[int], chunk_size: int = 65536
+) -> pd.DataFrame:
+    """
+    Return the unique rows in order. With max_values, the scan stops once more than
+    max_values unique rows are found, so the result may stop short of the full set.
+    """
+    if max_values is None:
+        return dataset.drop_duplicates()
+
+    unique_rows = dataset.iloc[0:0]
+    for start in range(0, len(dataset), chunk_size):
+        chunk = dataset.iloc[start : start + chunk_size]
+        unique_rows = pd.concat([unique_rows, chunk]).drop_duplicates()
+        if len(unique_rows) > max_values:
+            break
+    return unique_rows
+
+
 def generate_sql_statement(
     dataset: pd.DataFrame, table_name: str, max_values: Optional[int] = None
 ) -> str:
@@ -247,7 +713,8 @@ def generate_sql_statement(
         return "-- No data to generate SELECT statement"
 
     # Get unique rows (combinations of all columns) for compound keys
-    unique_rows = dataset.drop_duplicates()
+    # Only one row past max_values is needed to know the statement will be truncated
+    unique_rows = _first_unique_rows(dataset, max_values)
 
     # Limit the number of rows if max_values is specified
     if max_values is not None and len(unique_rows) > max_values:
@@ -259,8 +726,7 @@ def generate_sql_statement(
     # Handle single column case (simple key)
     if len(dataset.columns) == 1:
         column_name = dataset.columns[0]
-        values = unique_rows.iloc[:, 0].tolist()
-        formatted_values = [format_value_for_sql_in(val) for val in values]
+        formatted_values = format_series_for_sql_in(unique_rows.iloc[:, 0])
 
         if len(formatted_values) == 1:
             where_clause = f"WHERE {column_name} = {formatted_values[0]}"
@@ -276,14 +742,18 @@ def generate_sql_statement(
     else:
         column_names = list(dataset.columns)
 
-        # Create condition clauses for each row using AND/OR logic (SQL Server compatible)
+        # Format each column once, then create condition clauses for each row using
+        # AND/OR logic (SQL Server compatible)
+        formatted_columns = [
+            format_series_for_sql_in(unique_rows.iloc[:, i]) for i in range(len(column_names))
+        ]
         row_conditions = []
-        for _, row in unique_rows.iterrows():
+        for row_values in zip(*formatted_columns, strict=True):
             # Create AND conditions for each column in the row
-            column_conditions = []
-            for i, col_name in enumerate(column_names):
-                formatted_value = format_value_for_sql_in(row.iloc[i])
-                column_conditions.append(f"{col_name} = {formatted_value}")
+            column_conditions = [
+                f"{col_name} = {formatted_value}"
+                for col_name, formatted_value in zip(column_names, row_values, strict=True)
+            ]
 
             # Join column conditions with AND, wrap in parentheses
             row_condition = f"({' AND '.join(column_conditions)})"
@@ -310,6 +780,18 @@ def generate_sql_statement(
     return select_statement
 
 
+def _write_csv(dataset: pd.DataFrame, file_path: Path) -> None:
+    """Write a dataset as CSV through Arrow's multi-threaded C++ writer"""
+    try:
+        table = pa.Table.from_pandas(dataset, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Object columns mixing value types have no Arrow type; pandas writes them as text
+        with open(file_path, "w", buffering=_OUTPUT_BUFFER_SIZE, newline="") as fh:
+            dataset.to_csv(fh, index=False, chunksize=50_000, lineterminator="\n")
+        return
+    pacsv.write_csv(table, file_path)
+
+
 def generate_output_file(
     name: str,
     output_type: str,
@@ -326,8 +808,8 @@ def generate_output_file(
 
     clean_name = name.lower()
     clean_name = clean_name.replace(" ", "_")
-    clean_name = re.sub(r"_+", "_", clean_name)
-    clean_name = re.sub(r"[^a-z0-9_-]", "", clean_name)
+    clean_name = _UNDERSCORE_RUN_RE.sub("_", clean_name)
+    clean_name = _UNSAFE_FILENAME_CHARS_RE.sub("", clean_name)
 
     # Determine filename based on timestamp preference
     if timestamp_file:
@@ -339,16 +821,27 @@ def generate_output_file(
     # Generate file based on format
     if format.lower() == "csv":
         file_path = output_path / f"{filename}.csv"
-        dataset.to_csv(file_path, index=False)
+        _write_csv(dataset, file_path)
     elif format.lower() == "json":
         file_path = output_path / f"{filename}.json"
-        dataset.to_json(file_path, orient="records", lines=True)
+        with open(file_path, "w", buffering=_OUTPUT_BUFFER_SIZE) as fh:
+            dataset.to_json(fh, orient="records", lines=True)
+    elif format.lower() == "parquet":
+        file_path = output_path / f"{filename}.parquet"
+        dataset.to_parquet(
+            file_path, engine="pyarrow", compression="zstd", use_dictionary=True, index=False
+        )
     elif format.lower() == "sql":
         file_path = output_path / f"{filename}.sql"
+        # The bounded scan stops past max_sql_in_values, so the header count is a lower bound
+        # then; deduplicating the few rows kept again in generate_sql_statement is cheap
+        unique_rows = _first_unique_rows(dataset, max_sql_in_values)
         sql_statement = generate_sql_statement(
-            dataset, table_name=table_name, max_values=max_sql_in_values
+            unique_rows, table_name=table_name, max_values=max_sql_in_values
         )
-        unique_rows_count = len(dataset.drop_duplicates()) if not dataset.empty else 0
+        unique_rows_count = str(len(unique_rows))
+        if max_sql_in_values is not None and len(unique_rows) > max_sql_in_values:
+            unique_rows_count = f"more than {max_sql_in_values}"
         key_columns = ", ".join(dataset.columns) if not dataset.empty else "N/A"
         sql_content = f"""-- SQL SELECT Statement for "{name}"
 -- Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
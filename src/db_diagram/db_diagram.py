@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dotenv import load_dotenv
@@ -138,7 +139,7 @@ def _get_hierarchical_tables(service: MetadataService, config: DiagramConfig) ->
         related_tables = _apply_depth_filter(related_tables, hierarchy, config.hierarchy_max_depth)
 
     # Populate metadata (including foreign keys) for all tables in the hierarchy
-    _populate_table_metadata(service, related_tables)
+    _populate_table_metadata(service, related_tables, config.introspection_workers)
 
     return list(related_tables)
 
@@ -152,25 +153,19 @@ def _find_base_table(service: MetadataService, config: DiagramConfig) -> DbTable
     base_table = DbTable(schema_name=config.schema, table_name=config.base_table)
 
     # Verify the table exists and populate its metadata
-    try:
-        service.get_table_columns(base_table)
-        service.get_primary_key(base_table)
-        service.get_foreign_keys(base_table)
-        return base_table
-    except Exception as e:
-        raise ValueError(
-            f"Base table '{config.base_table}' not found in schema '{config.schema}'"
-        ) from e
+    _populate_table_metadata(service, {base_table}, workers=1)
+    if not base_table.all_columns:
+        raise ValueError(f"Base table '{config.base_table}' not found in schema '{config.schema}'")
+    return base_table
 
 
 def _collect_related_tables(hierarchy: Hierarchy, direction: str) -> set[DbTable]:
     """Collect related tables based on hierarchy direction"""
     related_tables: set[DbTable] = set([hierarchy.root_table])
 
-    if direction in ["down", "both"]:
-        _add_relationship_tables(related_tables, hierarchy.relationships)
-
-    if direction in ["up", "both"]:
+    # Every relationship contributes both of its tables in either direction,
+    # so "both" needs the same single pass as "up" or "down"
+    if direction in {"up", "down", "both"}:
         _add_relationship_tables(related_tables, hierarchy.relationships)
 
     return related_tables
@@ -188,25 +183,39 @@ def _apply_depth_filter(
 ) -> set[DbTable]:
     """Filter tables by maximum hierarchy depth"""
     filtered_tables: set[DbTable] = set([hierarchy.root_table])
+    tables_by_key = {table.key: table for table in related_tables}
     for table_key, level in hierarchy.table_levels.items():
-        if level <= max_depth:
-            for table in related_tables:
-                if f"{table.schema_name}.{table.table_name}" == table_key:
-                    filtered_tables.add(table)
-                    break
+        if level <= max_depth and table_key in tables_by_key:
+            filtered_tables.add(tables_by_key[table_key])
     return filtered_tables
 
 
-def _populate_table_metadata(service: MetadataService, tables: set[DbTable]) -> None:
+def _populate_table_metadata(service: MetadataService, tables: set[DbTable], workers: int) -> None:
     """Populate metadata (columns, primary keys, foreign keys) for all tables"""
-    for table in tables:
-        try:
-            service.get_table_columns(table)
-            service.get_primary_key(table)
-            service.get_foreign_keys(table)
-        except Exception:
-            # Skip tables that can't be populated (might not exist)
-            continue
+    # Tables that don't exist simply come back without columns or keys
+    failed = service.bulk_populate(tables)
+    if not failed:
+        return
+
+    # Fall back to per-table introspection; each round-trip waits on the database,
+    # so running them on threads overlaps the latency
+    console.print(f"[dim]Loading metadata for {len(failed)} tables individually[/]")
+    with (
+        service.connection.pooled(),
+        ThreadPoolExecutor(max_workers=max(1, min(len(failed), workers))) as executor,
+    ):
+        list(executor.map(lambda table: _safe_populate(service, table), failed))
+
+
+def _safe_populate(service: MetadataService, table: DbTable) -> None:
+    """Populate one table's metadata, skipping tables that can't be populated"""
+    try:
+        service.get_table_columns(table)
+        service.get_primary_key(table)
+        service.get_foreign_keys(table)
+    except Exception:
+        # Skip tables that can't be populated (might not exist)
+        pass
 
 
 if __name__ == "__main__":
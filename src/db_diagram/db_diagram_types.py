@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
-from utils import get_connection
+from utils import get_connection, modify_connection_for_database
 from utils.rich_utils import console
 
 DiagramFormat = Literal["dbml", "mermaid", "plantuml"]
@@ -68,6 +68,9 @@ class DiagramConfig:
         self.output_file_base: str = config.get("output_file", "database_erd")
         self.output_directory: str = config.get("output_directory", "./output/diagrams")
 
+        # Threads for per-table metadata queries when bulk introspection is unavailable
+        self.introspection_workers: int = config.get("introspection_workers", 8)
+
         # Database override
         self.database: str = config.get("database", "")
 
@@ -76,8 +79,6 @@ class DiagramConfig:
 
         # Apply database override if specified
         if self.database:
-            from utils import modify_connection_for_database
-
             self.connection = modify_connection_for_database(self.connection, self.database)
 
     @property
@@ -1,8 +1,11 @@
 import contextlib
 import os
 import re
-from dataclasses import dataclass
-from typing import Generator, Optional, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
+from queue import Empty, Queue
+from typing import Dict, Generator, Optional, Union
+from urllib.parse import quote
 
 import psycopg2
 import pyodbc
@@ -12,12 +15,24 @@ from sqlalchemy.engine import Engine
 ConnectionType = Union[pyodbc.Connection, "psycopg2.extensions.connection"]
 
 
+@lru_cache(maxsize=None)
+def _create_cached_engine(url: str) -> Engine:
+    """Create one engine per URL, so its connection pool is shared by every caller"""
+    # Pooled connections outlive individual queries, so check them before reuse and replace
+    # them before server or firewall idle timeouts can drop them
+    return create_engine(url, pool_pre_ping=True, pool_recycle=1800)
+
+
 @dataclass
 class Connection:
     connection_string: str
     db_type: Optional[str] = None  # "mssql" or "postgres"
     driver: Optional[str] = None
     encrypt: Optional[str] = None
+    # Idle connections kept open for reuse while inside pooled()
+    _pool: Optional["Queue[ConnectionType]"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Set default values for if not provided."""
@@ -32,6 +47,10 @@ class Connection:
         self,
     ) -> Generator[Union[pyodbc.Connection, "psycopg2.extensions.connection"], None, None]:
         """Context manager for database connections to ensure they're always closed."""
+        if self._pool is not None:
+            yield from self._checkout_pooled(self._pool)
+            return
+
         conn = None
         try:
             conn = self.connect()
@@ -40,6 +59,44 @@ class Connection:
             if conn:
                 conn.close()
 
+    def _checkout_pooled(
+        self, pool: "Queue[ConnectionType]"
+    ) -> Generator[ConnectionType, None, None]:
+        """Borrow an idle pooled connection, or open one, and hand it back afterwards."""
+        try:
+            conn = pool.get_nowait()
+        except Empty:
+            conn = self.connect()
+        try:
+            yield conn
+        finally:
+            try:
+                # Discard any open transaction, and temp tables created in it, before reuse
+                conn.rollback()
+                pool.put(conn)
+            except Exception:
+                conn.close()
+
+    @contextlib.contextmanager
+    def pooled(self) -> Generator[None, None, None]:
+        """
+        Reuse open connections across get_connection() calls until the block exits.
+
+        Each checkout still gets a connection to itself, so concurrent callers stay isolated,
+        but the login handshake is paid once per connection rather than once per query.
+        """
+        if self._pool is not None:
+            yield
+            return
+
+        self._pool = Queue()
+        try:
+            yield
+        finally:
+            pool, self._pool = self._pool, None
+            while not pool.empty():
+                pool.get_nowait().close()
+
     @property
     def server(self) -> str:
         """Extract server name from connection string."""
@@ -89,6 +146,35 @@ class Connection:
             return f"{self.connection_string};Driver={self.driver};Encrypt={self.encrypt}"
         return self.connection_string
 
+    @property
+    def uri(self) -> str:
+        """Build a URL-style connection string for URI-based readers such as ConnectorX."""
+        params: Dict[str, str]
+        if self.db_type == "postgres":
+            if self.connection_string.startswith("postgresql://"):
+                return self.connection_string
+            params = dict(re.findall(r"(\w+)\s*=\s*([^\s]+)", self.connection_string))
+            user = quote(params.get("user", ""), safe="")
+            password = quote(params.get("password", ""), safe="")
+            credentials = f"{user}:{password}@" if user else ""
+            port = f":{params['port']}" if "port" in params else ""
+            return f"postgresql://{credentials}{params.get('host', '')}{port}/{self.database}"
+        elif self.db_type == "mssql":
+            params = {
+                key.strip().lower(): value.strip()
+                for key, value in re.findall(r"([^;=]+)=([^;]*)", self.connection_string)
+            }
+            user = quote(params.get("uid", params.get("user id", "")), safe="")
+            password = quote(params.get("pwd", params.get("password", "")), safe="")
+            credentials = f"{user}:{password}@" if user else ""
+            server = params.get("server", "").removeprefix("tcp:").replace(",", ":")
+            encrypt = "true" if (self.encrypt or "").lower() in ("yes", "true") else "false"
+            uri = f"mssql://{credentials}{server}/{self.database}?encrypt={encrypt}"
+            if not user:
+                uri += "&trusted_connection=true"
+            return uri
+        raise ValueError(f"Unsupported database type: {self.db_type}")
+
     def connect(self) -> Union[pyodbc.Connection, "psycopg2.extensions.connection"]:
         """Create and return a database connection."""
         if self.db_type == "mssql":
@@ -102,8 +188,10 @@ class Connection:
         """
         Get a SQLAlchemy engine for this connection.
 
-        This creates a SQLAlchemy engine that can be used with pandas
-        and other libraries that work with SQLAlchemy.
+        This returns a SQLAlchemy engine that can be used with pandas
+        and other libraries that work with SQLAlchemy. Engines are cached
+        per connection URL, so repeated queries against the same database
+        reuse pooled connections instead of opening a new one each time.
 
         Returns:
             SQLAlchemy engine instance
@@ -111,14 +199,14 @@ class Connection:
         if self.db_type == "mssql":
             # Create SQLAlchemy engine using the pyodbc driver
             odbc_connect = self.full_connection_string
-            engine = create_engine(f"mssql+pyodbc:///?odbc_connect={odbc_connect}")
+            engine = _create_cached_engine(f"mssql+pyodbc:///?odbc_connect={odbc_connect}")
             return engine
         elif self.db_type == "postgres":
             if self.connection_string.startswith("postgresql://"):
-                engine = create_engine(self.connection_string)
+                engine = _create_cached_engine(self.connection_string)
             else:
                 # For connection strings in key=value format
-                engine = create_engine(f"postgresql+psycopg2://{self.connection_string}")
+                engine = _create_cached_engine(f"postgresql+psycopg2://{self.connection_string}")
             return engine
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
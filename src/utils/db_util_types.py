@@ -1,5 +1,7 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, Iterator, List, Optional
 
 
 @dataclass
@@ -13,6 +15,13 @@ class PrimaryKey:
     name: str
     columns: List[DbColumn] = field(default_factory=list)
 
+    def is_unique_over(self, columns: List[DbColumn]) -> bool:
+        """Whether rows projected onto these columns are unique, i.e. they contain the key"""
+        selected = {col.column_name.lower() for col in columns}
+        return bool(self.columns) and all(
+            col.column_name.lower() in selected for col in self.columns
+        )
+
 
 @dataclass
 class UniqueKey:
@@ -35,7 +44,7 @@ class ForeignKey:
             raise ValueError("Number of parent columns must match number of referenced columns")
 
 
-@dataclass
+@dataclass(slots=True)
 class DbTable:
     schema_name: str
     table_name: str
@@ -44,10 +53,20 @@ class DbTable:
     foreign_keys: Dict[str, ForeignKey] = field(default_factory=dict)
     all_columns: List[DbColumn] = field(default_factory=list)
     where_conditions: str | None = None
+    # "schema.table" lookup keys, computed once rather than formatted on every use
+    key: str = field(init=False, repr=False, compare=False)
+    key_lower: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so dict lookups across the cascade can match keys by identity
+        self.key = sys.intern(f"{self.schema_name}.{self.table_name}")
+        self.key_lower = sys.intern(self.key.lower())
+        self._hash = hash((self.schema_name, self.table_name))
 
     def __hash__(self) -> int:
         """Make DbTable hashable based on schema and table name"""
-        return hash((self.schema_name, self.table_name))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         """Define equality based on schema and table name"""
@@ -114,42 +133,48 @@ class Hierarchy:
 
     def get_deletion_order(self) -> list[DbTable]:
         """
-        Return tables in deletion order based on hierarchy levels.
-        Tables with higher levels (child tables) come before tables with lower levels (parents).
+        Return tables in deletion order.
+        Tables holding a foreign key (higher levels) come before the tables they reference.
         """
-        all_tables = []
-        table_key_to_table = {}
-
-        # Add root table
-        root_key = f"{self.root_table.schema_name}.{self.root_table.table_name}"
-        all_tables.append(root_key)
-        table_key_to_table[root_key] = self.root_table
+        return [table for wave in self.get_deletion_waves() for table in wave]
 
-        # Add all tables from relationships
+    def get_deletion_waves(self) -> Iterator[list[DbTable]]:
+        """
+        Yield groups of tables in deletion order.
+        Tables within a wave don't reference each other, so each wave can be deleted in parallel.
+        """
+        table_key_to_table = {self.root_table.key: self.root_table}
         for rel in self.relationships:
-            parent_key = f"{rel.parent_table.schema_name}.{rel.parent_table.table_name}"
-            ref_key = f"{rel.referenced_table.schema_name}.{rel.referenced_table.table_name}"
-
-            if parent_key not in table_key_to_table:
-                all_tables.append(parent_key)
-                table_key_to_table[parent_key] = rel.parent_table
-
-            if ref_key not in table_key_to_table:
-                all_tables.append(ref_key)
-                table_key_to_table[ref_key] = rel.referenced_table
+            table_key_to_table.setdefault(rel.parent_table.key, rel.parent_table)
+            table_key_to_table.setdefault(rel.referenced_table.key, rel.referenced_table)
 
-        # Sort tables by hierarchy level (descending)
-        # Tables with higher levels (children) should be deleted before lower levels (parents)
-        tables_with_levels = []
-        for table_key in all_tables:
-            level = self.table_levels.get(table_key, 0)
-            tables_with_levels.append((table_key, level))
+        def level_order(table_keys: list[str]) -> list[str]:
+            # Higher levels first; the sort is stable, so ties keep discovery order
+            return sorted(table_keys, key=lambda k: self.table_levels.get(k, 0), reverse=True)
 
-        # Sort by level in descending order (higher levels first)
-        tables_with_levels.sort(key=lambda x: x[1], reverse=True)
-
-        # Return tables in proper order
-        return [table_key_to_table[table_key] for table_key, _ in tables_with_levels]
+        sorter: TopologicalSorter[str] = TopologicalSorter()
+        for table_key in table_key_to_table:
+            sorter.add(table_key)
+        for rel in self.relationships:
+            parent_key = rel.parent_table.key
+            referenced_key = rel.referenced_table.key
+            # Self-references are removed by the same DELETE, so they impose no ordering
+            if parent_key != referenced_key:
+                # The referencing table must be emptied before the table it references
+                sorter.add(referenced_key, parent_key)
+
+        try:
+            sorter.prepare()
+        except CycleError:
+            # Circular foreign keys have no topological order, so fall back to hierarchy levels
+            for table_key in level_order(list(table_key_to_table)):
+                yield [table_key_to_table[table_key]]
+            return
+
+        while sorter.is_active():
+            wave = level_order(list(sorter.get_ready()))
+            yield [table_key_to_table[table_key] for table_key in wave]
+            sorter.done(*wave)
 
     def rebuild_table_levels(self) -> None:
         """Rebuild table levels using all relationships"""
@@ -157,7 +182,7 @@ class Hierarchy:
         self.table_levels.clear()
 
         # Root table is level 0
-        root_key = f"{self.root_table.schema_name}.{self.root_table.table_name}"
+        root_key = self.root_table.key
         self.table_levels[root_key] = 0
 
         # Keep assigning levels until no changes
@@ -170,10 +195,8 @@ class Hierarchy:
             iteration += 1
 
             for rel in self.relationships:
-                parent_key = f"{rel.parent_table.schema_name}.{rel.parent_table.table_name}"
-                referenced_key = (
-                    f"{rel.referenced_table.schema_name}.{rel.referenced_table.table_name}"
-                )
+                parent_key = rel.parent_table.key
+                referenced_key = rel.referenced_table.key
 
                 # If referenced table has a level, parent should be at least level + 1
                 if referenced_key in self.table_levels:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from utils.connection_utils import Connection
 from utils.db_util_types import (
@@ -12,6 +12,70 @@ from utils.db_util_types import (
 )
 from utils.rich_utils import console
 
+# Tables per bulk catalog query; keeps the IN-list parameters well under SQL Server's 2100 limit
+INTROSPECTION_BATCH_SIZE = 500
+
+# Bulk variants of the per-table catalog queries below, prefixed with each row's schema and table
+COLUMNS_BULK_QUERY = """
+SELECT
+    TABLE_SCHEMA,
+    TABLE_NAME,
+    COLUMN_NAME,
+    DATA_TYPE + CASE
+        WHEN CHARACTER_MAXIMUM_LENGTH IS NOT NULL
+        THEN '(' + CAST(CHARACTER_MAXIMUM_LENGTH AS VARCHAR) + ')'
+        ELSE '' END AS DATA_TYPE
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA IN ({schema_params})
+    AND TABLE_NAME IN ({table_params})
+ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+"""
+
+PRIMARY_KEYS_BULK_QUERY = """
+SELECT
+    OBJECT_SCHEMA_NAME(kc.parent_object_id) AS schema_name,
+    OBJECT_NAME(kc.parent_object_id) AS table_name,
+    kc.name AS constraint_name,
+    c.name AS column_name,
+    c.column_id AS column_id,
+    TYPE_NAME(c.system_type_id) AS data_type,
+    c.is_identity AS is_identity
+FROM sys.key_constraints kc
+INNER JOIN sys.index_columns ic
+    ON kc.parent_object_id = ic.object_id AND kc.unique_index_id = ic.index_id
+INNER JOIN sys.columns c
+    ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+WHERE kc.type = 'PK'
+    AND OBJECT_SCHEMA_NAME(kc.parent_object_id) IN ({schema_params})
+    AND OBJECT_NAME(kc.parent_object_id) IN ({table_params})
+ORDER BY schema_name, table_name, ic.key_ordinal
+"""
+
+FOREIGN_KEYS_BULK_QUERY = """
+SELECT
+    OBJECT_SCHEMA_NAME(FK.parent_object_id) AS schema_name,
+    OBJECT_NAME(FK.parent_object_id) AS table_name,
+    FK.name AS foreign_key_name,
+    OBJECT_SCHEMA_NAME(FKC.parent_object_id) AS parent_schema,
+    OBJECT_NAME(FKC.parent_object_id) AS parent_table,
+    C.name AS parent_column,
+    OBJECT_SCHEMA_NAME(FKC.referenced_object_id) AS referenced_schema,
+    OBJECT_NAME(FKC.referenced_object_id) AS referenced_table,
+    CR.name AS referenced_column,
+    FKC.constraint_column_id AS column_ordinal,
+    TYPE_NAME(C.system_type_id) AS parent_data_type,
+    TYPE_NAME(CR.system_type_id) AS referenced_data_type
+FROM sys.foreign_keys AS FK
+JOIN sys.foreign_key_columns AS FKC ON FK.object_id = FKC.constraint_object_id
+JOIN sys.columns AS C ON FKC.parent_column_id = C.column_id
+    AND FKC.parent_object_id = C.object_id
+JOIN sys.columns AS CR ON FKC.referenced_column_id = CR.column_id
+    AND FKC.referenced_object_id = CR.object_id
+WHERE OBJECT_SCHEMA_NAME(FK.parent_object_id) IN ({schema_params})
+    AND OBJECT_NAME(FK.parent_object_id) IN ({table_params})
+ORDER BY schema_name, table_name, foreign_key_name, column_ordinal
+"""
+
 
 class MetadataService:
     """Service for retrieving database metadata"""
@@ -38,12 +102,7 @@ class MetadataService:
             cursor = db_conn.cursor()
             try:
                 cursor.execute(query)
-                rows = cursor.fetchall()
-
-                for row in rows:
-                    column_name = row[0]
-                    data_type = row[1]
-                    columns.append(DbColumn(column_name, data_type))
+                columns = self._columns_from_rows(cursor.fetchall())
             except Exception as e:
                 console.print(f"Error getting columns for '{table.full_table_name()}': {e}")
             finally:
@@ -78,27 +137,7 @@ class MetadataService:
             cursor = db_conn.cursor()
             try:
                 cursor.execute(query)
-                rows = cursor.fetchall()
-
-                if rows:
-                    # Get constraint name from first row
-                    constraint_name = rows[0][0]
-                    pk = PrimaryKey(constraint_name)
-
-                    # Process all columns in the key
-                    for row in rows:
-                        column_name = row[1]
-                        data_type = row[3]
-
-                        # Find column in existing columns or create new
-                        col = next(
-                            (c for c in table.all_columns if c.column_name == column_name), None
-                        )
-                        if col is None:
-                            col = DbColumn(column_name, data_type)
-
-                        pk.columns.append(col)
-
+                pk = self._primary_key_from_rows(table, cursor.fetchall())
             except Exception as e:
                 console.print(f"Error getting primary key for '{table.full_table_name()}': {e}")
             finally:
@@ -135,62 +174,11 @@ class MetadataService:
         """
 
         foreign_keys = {}
-        fk_data = {}
-
         with self.connection.get_connection() as db_conn:
             cursor = db_conn.cursor()
             try:
                 cursor.execute(query)
-                rows = cursor.fetchall()
-
-                for row in rows:
-                    fk_name = row[0]
-                    parent_schema = row[1]
-                    parent_table = row[2]
-                    parent_column = row[3]
-                    referenced_schema = row[4]
-                    referenced_table = row[5]
-                    referenced_column = row[6]
-                    parent_data_type = row[8]
-                    referenced_data_type = row[9]
-
-                    # Initialize data structure for this FK if it doesn't exist
-                    if fk_name not in fk_data:
-                        fk_data[fk_name] = {
-                            "parent_schema": parent_schema,
-                            "parent_table": parent_table,
-                            "referenced_schema": referenced_schema,
-                            "referenced_table": referenced_table,
-                            "parent_columns": [],
-                            "referenced_columns": [],
-                        }
-
-                        # Find or create parent column
-                        parent_col = next(
-                            (c for c in table.all_columns if c.column_name == parent_column), None
-                        )
-                        if parent_col is None:
-                            parent_col = DbColumn(parent_column, parent_data_type)
-
-                        # Create referenced column
-                        referenced_col = DbColumn(referenced_column, referenced_data_type)
-
-                        # Add columns to the data
-                        fk_data[fk_name]["parent_columns"].append(parent_col)
-                        fk_data[fk_name]["referenced_columns"].append(referenced_col)
-
-                    # Create ForeignKey objects from collected data
-                    for fk_name, data in fk_data.items():
-                        foreign_keys[fk_name] = ForeignKey(
-                            name=fk_name,
-                            parent_schema=data["parent_schema"],
-                            parent_table=data["parent_table"],
-                            parent_columns=data["parent_columns"],
-                            referenced_schema=data["referenced_schema"],
-                            referenced_table=data["referenced_table"],
-                            referenced_columns=data["referenced_columns"],
-                        )
-
+                foreign_keys = self._foreign_keys_from_rows(table, cursor.fetchall())
             except Exception as e:
                 print(f"Error getting foreign keys for '{table.full_table_name()}': {e}")
             finally:
@@ -200,6 +188,150 @@ class MetadataService:
         table.foreign_keys.update(foreign_keys)
         return foreign_keys
 
+    def bulk_populate(self, tables: Iterable[DbTable]) -> List[DbTable]:
+        """
+        Populate columns, primary keys and foreign keys for many tables at once.
+
+        Issues three catalog queries per batch of tables instead of three per table, then
+        hands each table its own rows, so the results match the per-table getters.
+        Returns the tables left unpopulated because a bulk query failed.
+        """
+        table_list = list(tables)
+        failed: List[DbTable] = []
+        for start in range(0, len(table_list), INTROSPECTION_BATCH_SIZE):
+            batch = table_list[start : start + INTROSPECTION_BATCH_SIZE]
+
+            column_rows = self._fetch_rows_by_table(COLUMNS_BULK_QUERY, batch, "columns")
+            pk_rows = self._fetch_rows_by_table(PRIMARY_KEYS_BULK_QUERY, batch, "primary keys")
+            fk_rows = self._fetch_rows_by_table(FOREIGN_KEYS_BULK_QUERY, batch, "foreign keys")
+            if column_rows is None or pk_rows is None or fk_rows is None:
+                failed.extend(batch)
+                continue
+
+            for table in batch:
+                key = table.key_lower
+                table.all_columns = self._columns_from_rows(column_rows.get(key, []))
+                pk = self._primary_key_from_rows(table, pk_rows.get(key, []))
+                if pk:
+                    table.primary_key = pk
+                table.foreign_keys.update(self._foreign_keys_from_rows(table, fk_rows.get(key, [])))
+        return failed
+
+    def _fetch_rows_by_table(
+        self, query_template: str, tables: List[DbTable], description: str
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Run a bulk catalog query filtered to the given tables and group its rows by table.
+        The query's first two columns must be the schema and table name; they are stripped
+        from the grouped rows so these match what the per-table queries return.
+        Returns None if the query fails.
+        """
+        schemas = sorted({table.schema_name for table in tables})
+        names = sorted({table.table_name for table in tables})
+        query = query_template.format(
+            schema_params=", ".join("?" * len(schemas)), table_params=", ".join("?" * len(names))
+        )
+        wanted = {table.key_lower for table in tables}
+
+        rows_by_table: Dict[str, List[Any]] = {}
+        with self.connection.get_connection() as db_conn:
+            cursor = db_conn.cursor()
+            try:
+                cursor.execute(query, *schemas, *names)
+                for row in cursor.fetchall():
+                    # The IN-lists match a schema x table cross product; keep only requested pairs
+                    key = f"{row[0]}.{row[1]}".lower()
+                    if key in wanted:
+                        rows_by_table.setdefault(key, []).append(tuple(row)[2:])
+            except Exception as e:
+                console.print(f"Error getting {description} for {len(tables)} tables: {e}")
+                return None
+            finally:
+                cursor.close()
+        return rows_by_table
+
+    @staticmethod
+    def _columns_from_rows(rows: List[Any]) -> List[DbColumn]:
+        """Build columns from (column_name, data_type) rows"""
+        return [DbColumn(row[0], row[1]) for row in rows]
+
+    @staticmethod
+    def _primary_key_from_rows(table: DbTable, rows: List[Any]) -> Optional[PrimaryKey]:
+        """Build a primary key from key column rows, reusing the table's known columns"""
+        if not rows:
+            return None
+
+        # Get constraint name from first row
+        pk = PrimaryKey(rows[0][0])
+
+        # Process all columns in the key
+        for row in rows:
+            column_name = row[1]
+            data_type = row[3]
+
+            # Find column in existing columns or create new
+            col = next((c for c in table.all_columns if c.column_name == column_name), None)
+            if col is None:
+                col = DbColumn(column_name, data_type)
+
+            pk.columns.append(col)
+        return pk
+
+    @staticmethod
+    def _foreign_keys_from_rows(table: DbTable, rows: List[Any]) -> Dict[str, ForeignKey]:
+        """Build foreign keys from foreign key column rows, reusing the table's known columns"""
+        foreign_keys = {}
+        fk_data: Dict[str, Dict[str, Any]] = {}
+
+        for row in rows:
+            fk_name = row[0]
+            parent_schema = row[1]
+            parent_table = row[2]
+            parent_column = row[3]
+            referenced_schema = row[4]
+            referenced_table = row[5]
+            referenced_column = row[6]
+            parent_data_type = row[8]
+            referenced_data_type = row[9]
+
+            # Initialize data structure for this FK if it doesn't exist
+            if fk_name not in fk_data:
+                fk_data[fk_name] = {
+                    "parent_schema": parent_schema,
+                    "parent_table": parent_table,
+                    "referenced_schema": referenced_schema,
+                    "referenced_table": referenced_table,
+                    "parent_columns": [],
+                    "referenced_columns": [],
+                }
+
+                # Find or create parent column
+                parent_col = next(
+                    (c for c in table.all_columns if c.column_name == parent_column), None
+                )
+                if parent_col is None:
+                    parent_col = DbColumn(parent_column, parent_data_type)
+
+                # Create referenced column
+                referenced_col = DbColumn(referenced_column, referenced_data_type)
+
+                # Add columns to the data
+                fk_data[fk_name]["parent_columns"].append(parent_col)
+                fk_data[fk_name]["referenced_columns"].append(referenced_col)
+
+        # Create ForeignKey objects from collected data
+        for fk_name, data in fk_data.items():
+            foreign_keys[fk_name] = ForeignKey(
+                name=fk_name,
+                parent_schema=data["parent_schema"],
+                parent_table=data["parent_table"],
+                parent_columns=data["parent_columns"],
+                referenced_schema=data["referenced_schema"],
+                referenced_table=data["referenced_table"],
+                referenced_columns=data["referenced_columns"],
+            )
+        return foreign_keys
+
     def get_unique_keys(self, table: DbTable) -> Dict[str, UniqueKey]:
         """Get unique keys for a table"""
         query = f"""
@@ -291,6 +423,86 @@ class MetadataService:
                 cursor.close()
         return data_type
 
+    @staticmethod
+    def key_checksum_expression(table: DbTable) -> str:
+        """SQL aggregate fingerprinting a table's primary key values, 0 for an empty table"""
+        pk_columns = table.primary_key.columns if table.primary_key else []
+        columns_sql = ", ".join(f"[{col.column_name}]" for col in pk_columns)
+        return f"ISNULL(CHECKSUM_AGG(BINARY_CHECKSUM({columns_sql})), 0)"
+
+    def get_key_fingerprint(self, table: DbTable) -> Optional[Tuple[int, int]]:
+        """
+        Returns a table's exact row count and a checksum over its primary key values,
+        or None if they could not be read
+        """
+        query = (
+            f"SELECT COUNT_BIG(*), {self.key_checksum_expression(table)} "
+            f"FROM {table.full_table_name()}"
+        )
+
+        fingerprint = None
+        with self.connection.get_connection() as db_conn:
+            cursor = db_conn.cursor()
+            try:
+                cursor.execute(query)
+                result = cursor.fetchone()
+
+                if result is not None:
+                    fingerprint = (int(result[0]), int(result[1]))
+
+            except Exception as e:
+                console.print(f"Error getting row count for '{table.full_table_name()}': {e}")
+            finally:
+                cursor.close()
+        return fingerprint
+
+    def can_truncate(self, table: DbTable) -> bool:
+        """
+        Returns whether TRUNCATE can stand in for deleting every row of a table.
+        SQL Server refuses TRUNCATE on tables referenced by foreign keys (even disabled ones)
+        or by indexed views, and on replicated, CDC-tracked and system-versioned tables.
+        Tables with triggers or an identity column are excluded too, because TRUNCATE skips
+        the triggers and resets the identity seed where a DELETE would not.
+        """
+        object_name = table.full_table_name().replace("'", "''")
+        query = f"""
+        SELECT
+            (SELECT COUNT(*) FROM sys.foreign_keys
+                WHERE referenced_object_id = t.object_id
+                    AND parent_object_id <> referenced_object_id) AS referencing_fks,
+            (SELECT COUNT(*) FROM sys.triggers
+                WHERE parent_id = t.object_id) AS triggers,
+            (SELECT COUNT(*) FROM sys.identity_columns
+                WHERE object_id = t.object_id) AS identity_columns,
+            (SELECT COUNT(*) FROM sys.sql_expression_dependencies AS d
+                INNER JOIN sys.indexes AS i ON i.object_id = d.referencing_id
+                WHERE d.referenced_id = t.object_id
+                    AND OBJECTPROPERTY(d.referencing_id, 'IsView') = 1) AS indexed_views,
+            (SELECT COUNT(*) FROM sys.tables
+                WHERE object_id = t.object_id
+                    AND (is_replicated = 1 OR is_merge_published = 1
+                        OR is_tracked_by_cdc = 1 OR temporal_type <> 0)) AS restricted_tables
+        FROM (SELECT OBJECT_ID('{object_name}') AS object_id) AS t
+        """
+
+        truncatable = False
+        with self.connection.get_connection() as db_conn:
+            cursor = db_conn.cursor()
+            try:
+                cursor.execute(query)
+                result = cursor.fetchone()
+
+                if result is not None:
+                    truncatable = not any(result)
+
+            except Exception as e:
+                console.print(
+                    f"Error checking truncate eligibility for '{table.full_table_name()}': {e}"
+                )
+            finally:
+                cursor.close()
+        return truncatable
+
     def _get_hierarchy_query(self, root_table: DbTable) -> str:
         """Get the SQL query for building hierarchy"""
         return f"""
@@ -501,7 +713,7 @@ class MetadataService:
         hierarchy_paths = {}
 
         # Initialize with root table
-        root_key = f"{root_table.schema_name}.{root_table.table_name}"
+        root_key = root_table.key
         tables_cache[root_key] = root_table
         table_levels[root_key] = 0
         hierarchy_paths[root_key] = root_table.full_table_name()
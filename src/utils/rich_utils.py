@@ -1,6 +1,7 @@
 from typing import Dict, List, Literal, Optional, Tuple
 
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 JustifyType = Literal["left", "center", "right"]
@@ -27,6 +28,20 @@ COLORS = [
 ]
 
 
+def create_progress() -> Progress:
+    """Create a spinner Progress on the shared console.
+
+    Rendering is disabled when the console isn't a terminal (CI, cron, redirected output),
+    so non-interactive runs don't pay for screen refreshes nobody sees.
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[bold magenta]{task.description}"),
+        console=console,
+        disable=not console.is_terminal,
+    )
+
+
 def create_table(
     title: Optional[str] = None,
     columns: Optional[List[str]] = None,